@@ -8,6 +8,7 @@ import asyncio
 import logging
 from datetime import datetime, timezone
 from enum import Enum
+from hashlib import blake2b
 
 from langgraph.graph import StateGraph, END
 from langgraph.prebuilt import ToolExecutor, ToolInvocation
@@ -169,7 +170,8 @@ class MultiAgentWorkflow:
             raise RuntimeError("Workflow not compiled. Call compile() first.")
         
         if session_id is None:
-            session_id = f"session_{datetime.now(timezone.utc).timestamp()}"
+            query_digest = blake2b(user_query.encode(), digest_size=4).hexdigest()
+            session_id = f"session_{datetime.now(timezone.utc).timestamp()}_{query_digest}"
         
         # Initialize state
         initial_state: MultiAgentState = {
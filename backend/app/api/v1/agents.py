@@ -3,27 +3,151 @@ Agent Execution API endpoints for Enterprise Insights Copilot
 Implements Tasks 50-54: Agent execution, workflows, sessions, conversations, real-time updates
 """
 
-from typing import List, Optional, Dict, Any
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, WebSocket, WebSocketDisconnect
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel, Field
+from typing import List, Optional, Dict, Any, Set, Coroutine, Type, TypeVar, AsyncIterator
+from contextlib import aclosing
+from fastapi import APIRouter, HTTPException, Depends, Request, WebSocket, WebSocketDisconnect
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field, TypeAdapter
 from datetime import datetime
 import uuid
-import json
 import asyncio
+import re
+import msgspec
+import orjson
 import logging
-from dataclasses import asdict
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.services.agent_manager import agent_manager
-from app.services.session_manager import session_manager
+from app.services.session_manager import Session, session_manager
 from app.services.conversation_manager import conversation_manager
+from app.services.conversation_manager import ConversationMessage as StoredMessage
 
 logger = get_logger(__name__)
 settings = get_settings()
 
-router = APIRouter(prefix="/api/v1/agents", tags=["Agent System"])
+router = APIRouter(
+    prefix="/api/v1/agents",
+    tags=["Agent System"],
+    default_response_class=ORJSONResponse
+)
+
+# Every handler here is async def and must not block: the manager calls they make
+# (including the sync agent_manager status lookups) only touch in-memory state.
+# A handler that needs blocking I/O must use an async client or asyncio.to_thread.
+
+# Endpoints that build their payload from server-side state return an
+# ORJSONResponse directly, which skips response_model validation and
+# serialization; response_model is kept on the route for the OpenAPI schema.
+
+# Strong references to running executions so they are not garbage collected
+_running_tasks: Set[asyncio.Task] = set()
+
+def _spawn(coro: Coroutine) -> asyncio.Task:
+    """Schedule an execution on the event loop without waiting for the response to finish."""
+    task = asyncio.create_task(coro)
+    _running_tasks.add(task)
+    task.add_done_callback(_running_tasks.discard)
+    return task
+
+# Supported types, checked on every execution request
+_VALID_AGENTS = frozenset({"planning", "data_analysis", "query", "insight"})
+_VALID_WORKFLOWS = frozenset({"data_analysis", "insight_generation", "custom"})
+
+# Error details listing the supported types, built once
+_INVALID_AGENT_TYPE_DETAIL = f"Invalid agent type. Supported: {sorted(_VALID_AGENTS)}"
+_INVALID_WORKFLOW_TYPE_DETAIL = f"Invalid workflow type. Supported: {sorted(_VALID_WORKFLOWS)}"
+
+# Server-Sent Events framing
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+
+# WebSocket updates arriving within this many seconds are sent as one frame
+_WS_COALESCE_WINDOW = 0.015
+
+T = TypeVar("T")
+StructT = TypeVar("StructT", bound=msgspec.Struct)
+
+# msgspec reports where validation failed as a JSONPath suffix, e.g. "... - at `$.message.role`"
+_MSGSPEC_LOCATION = re.compile(r" - at `\$(?P<path>[^`]*)`$")
+_MSGSPEC_PATH_PART = re.compile(r"\.([^.\[]+)|\[(\d+)\]")
+_MSGSPEC_MISSING = re.compile(r"^Object missing required field `(?P<field>[^`]+)`$")
+_MSGSPEC_EXPECTED = re.compile(r"^Expected `(?P<expected>[^`|]+)")
+# Pydantic error types for msgspec's JSON type names, so clients see the same types as before
+_PYDANTIC_ERROR_TYPES = {
+    "str": "string_type",
+    "int": "int_type",
+    "float": "float_type",
+    "bool": "bool_type",
+    "object": "dict_type",
+    "array": "list_type",
+}
+
+def _validation_error(error: msgspec.ValidationError) -> Dict[str, Any]:
+    """Translate a msgspec validation error into a FastAPI error entry with a per-field loc."""
+    msg = str(error)
+    loc: List[Any] = ["body"]
+    location = _MSGSPEC_LOCATION.search(msg)
+    if location:
+        msg = msg[:location.start()]
+        loc.extend(
+            name or int(index)
+            for name, index in _MSGSPEC_PATH_PART.findall(location.group("path"))
+        )
+    missing = _MSGSPEC_MISSING.match(msg)
+    if missing:
+        return {"type": "missing", "loc": (*loc, missing.group("field")), "msg": "Field required", "input": None}
+    expected = _MSGSPEC_EXPECTED.match(msg)
+    error_type = _PYDANTIC_ERROR_TYPES.get(expected.group("expected").strip(), "value_error") if expected else "value_error"
+    return {"type": error_type, "loc": tuple(loc), "msg": msg, "input": None}
+
+def _body_as(struct_cls: Type[StructT]):
+    """
+    Dependency that decodes and validates a JSON body in one pass with msgspec.
+    
+    Lax mode accepts the same coercions as Pydantic, such as numeric datetime timestamps.
+    """
+    decoder = msgspec.json.Decoder(struct_cls, strict=False)
+    async def _parse(request: Request) -> StructT:
+        try:
+            return decoder.decode(await request.body())
+        except msgspec.ValidationError as e:
+            raise RequestValidationError([_validation_error(e)])
+        except msgspec.DecodeError as e:
+            raise RequestValidationError(
+                [{"type": "json_invalid", "loc": ("body",), "msg": str(e), "input": None}]
+            )
+    return _parse
+
+def _json_body(model_cls: Type[BaseModel]) -> Dict[str, Any]:
+    """OpenAPI requestBody for a route decoded by _body_as, documented with its Pydantic model."""
+    schema = model_cls.model_json_schema(ref_template="#/components/schemas/{model}")
+    schema.pop("$defs", None)
+    return {"requestBody": {"required": True, "content": {"application/json": {"schema": schema}}}}
+
+async def _coalesce(updates: AsyncIterator[T], window: float) -> AsyncIterator[List[T]]:
+    """Group items that arrive within `window` seconds of the first one into batches."""
+    loop = asyncio.get_running_loop()
+    # Keep one pending read and never cancel it on timeout: cancelling it would close the source
+    pending = asyncio.ensure_future(anext(updates))
+    try:
+        while True:
+            try:
+                batch = [await pending]
+            except StopAsyncIteration:
+                return
+            pending = asyncio.ensure_future(anext(updates))
+            deadline = loop.time() + window
+            while (remaining := deadline - loop.time()) > 0:
+                done, _ = await asyncio.wait((pending,), timeout=remaining)
+                if not done or pending.exception() is not None:
+                    break
+                batch.append(pending.result())
+                pending = asyncio.ensure_future(anext(updates))
+            yield batch
+    finally:
+        pending.cancel()
 
 # Pydantic Models
 class AgentExecutionRequest(BaseModel):
@@ -98,13 +222,40 @@ class StatusUpdate(BaseModel):
     timestamp: datetime
     metadata: Optional[Dict[str, Any]] = Field(default_factory=dict)
 
+# msgspec mirrors of the request models, used to decode the hot POST bodies;
+# the Pydantic models above stay the documented schema
+class AgentExecutionBody(msgspec.Struct):
+    agent_type: str
+    query: str
+    data_source: Optional[str] = None
+    session_id: Optional[str] = None
+    parameters: Optional[Dict[str, Any]] = {}
+
+class WorkflowExecutionBody(msgspec.Struct):
+    workflow_type: str
+    steps: List[Dict[str, Any]]
+    data_source: Optional[str] = None
+    session_id: Optional[str] = None
+
+class ConversationMessageBody(msgspec.Struct):
+    role: str
+    content: str
+    timestamp: Optional[datetime] = msgspec.field(default_factory=datetime.now)
+    metadata: Optional[Dict[str, Any]] = {}
+
+class ConversationBody(msgspec.Struct):
+    session_id: str
+    message: ConversationMessageBody
+    context: Optional[Dict[str, Any]] = {}
+
+# List serializers built once; they encode the manager dataclasses in a single call
+_SESSIONS_ADAPTER = TypeAdapter(List[Session])
+_MESSAGES_ADAPTER = TypeAdapter(List[StoredMessage])
+
 
 # Task 50: Create agent execution API endpoints
-@router.post("/execute", response_model=AgentExecutionResponse)
-async def execute_agent(
-    request: AgentExecutionRequest,
-    background_tasks: BackgroundTasks
-):
+@router.post("/execute", response_model=AgentExecutionResponse, openapi_extra=_json_body(AgentExecutionRequest))
+async def execute_agent(request: AgentExecutionBody = Depends(_body_as(AgentExecutionBody))):
     """
     Execute an AI agent with the specified query and parameters.
     
@@ -114,84 +265,70 @@ async def execute_agent(
     - query: Generates and executes database/data queries  
     - insight: Generates business insights and recommendations
     """
-    try:
-        # Generate execution ID
-        execution_id = str(uuid.uuid4())
-        
-        # Get or create session
-        if request.session_id:
-            session = await session_manager.get_session(request.session_id)
-            if not session:
-                raise HTTPException(status_code=404, detail="Session not found")
-        else:
-            session = await session_manager.create_session()
-            request.session_id = session.session_id
-        
-        # Validate agent type
-        valid_agents = ["planning", "data_analysis", "query", "insight"]
-        if request.agent_type not in valid_agents:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Invalid agent type. Supported: {valid_agents}"
-            )
-        
-        # Create execution record
-        execution_data = {
-            "execution_id": execution_id,
-            "agent_type": request.agent_type,
-            "query": request.query,
-            "data_source": request.data_source,
-            "session_id": request.session_id,
-            "parameters": request.parameters,
-            "status": "pending",
-            "timestamp": datetime.now()
-        }
-        
-        # Start agent execution in background
-        background_tasks.add_task(
-            agent_manager.execute_agent,
-            execution_id,
-            request.agent_type,
-            request.query,
-            request.data_source,
-            request.parameters
-        )
-        
-        logger.info(f"Started agent execution: {execution_id} (type: {request.agent_type})")
-        
-        return AgentExecutionResponse(
-            execution_id=execution_id,
-            agent_type=request.agent_type,
-            status="pending",
-            session_id=request.session_id,
-            timestamp=datetime.now(),
-            estimated_duration=30  # Default 30 seconds estimate
-        )
-        
-    except Exception as e:
-        logger.error(f"Agent execution failed: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Agent execution failed: {str(e)}")
+    # Generate execution ID
+    execution_id = str(uuid.uuid4())
+    now = datetime.now()
+    
+    # Get or create session
+    if request.session_id:
+        session = await session_manager.get_session(request.session_id)
+        if not session:
+            raise HTTPException(status_code=404, detail="Session not found")
+    else:
+        session = await session_manager.create_session()
+        request.session_id = session.session_id
+    
+    # Validate agent type
+    if request.agent_type not in _VALID_AGENTS:
+        raise HTTPException(status_code=400, detail=_INVALID_AGENT_TYPE_DETAIL)
+    
+    # Create execution record
+    execution_data = {
+        "execution_id": execution_id,
+        "agent_type": request.agent_type,
+        "query": request.query,
+        "data_source": request.data_source,
+        "session_id": request.session_id,
+        "parameters": request.parameters,
+        "status": "pending",
+        "timestamp": now
+    }
+    
+    # Start agent execution in background
+    _spawn(agent_manager.execute_agent(
+        execution_id,
+        request.agent_type,
+        request.query,
+        request.data_source,
+        request.parameters
+    ))
+    
+    logger.info("Started agent execution", execution_id=execution_id, agent_type=request.agent_type)
+    
+    # Server-generated values: skip field validation
+    response = AgentExecutionResponse.model_construct(
+        execution_id=execution_id,
+        agent_type=request.agent_type,
+        status="pending",
+        session_id=request.session_id,
+        timestamp=now,
+        estimated_duration=30  # Default 30 seconds estimate
+    )
+    return ORJSONResponse(response.model_dump())
 
 
 @router.get("/execution/{execution_id}")
 async def get_execution_status(execution_id: str):
     """Get the status of an agent execution."""
-    try:
-        status = agent_manager.get_execution_status(execution_id)
-        if not status:
-            raise HTTPException(status_code=404, detail="Execution not found")
-        return status
-    except Exception as e:
-        logger.error(f"Failed to get execution status: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    status = agent_manager.get_execution_status(execution_id)
+    if not status:
+        raise HTTPException(status_code=404, detail="Execution not found")
+    return ORJSONResponse(status)
 
 
 # Task 51: Implement workflow execution endpoints
-@router.post("/workflow/execute", response_model=WorkflowExecutionResponse)
-async def execute_workflow(
-    request: WorkflowExecutionRequest,
-    background_tasks: BackgroundTasks
-):
+@router.post("/workflow/execute", response_model=WorkflowExecutionResponse, openapi_extra=_json_body(WorkflowExecutionRequest))
+async def execute_workflow(request: WorkflowExecutionBody = Depends(_body_as(WorkflowExecutionBody))):
     """
     Execute a multi-step workflow with multiple agents.
     
@@ -200,145 +337,112 @@ async def execute_workflow(
     - insight_generation: Generate comprehensive business insights
     - custom: User-defined workflow steps
     """
-    try:
-        # Generate workflow ID
-        workflow_id = str(uuid.uuid4())
-        
-        # Get or create session
-        if request.session_id:
-            session = await session_manager.get_session(request.session_id)
-            if not session:
-                raise HTTPException(status_code=404, detail="Session not found")
-        else:
-            session = await session_manager.create_session()
-            request.session_id = session.session_id
-        
-        # Validate workflow type
-        valid_workflows = ["data_analysis", "insight_generation", "custom"]
-        if request.workflow_type not in valid_workflows:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid workflow type. Supported: {valid_workflows}"
-            )
-        
-        # Start workflow execution in background
-        background_tasks.add_task(
-            agent_manager.execute_workflow,
-            workflow_id,
-            request.workflow_type,
-            request.steps,
-            request.data_source,
-            request.session_id
-        )
-        
-        logger.info(f"Started workflow execution: {workflow_id} (type: {request.workflow_type})")
-        
-        return WorkflowExecutionResponse(
-            workflow_id=workflow_id,
-            workflow_type=request.workflow_type,
-            status="pending",
-            session_id=request.session_id,
-            steps_total=len(request.steps),
-            steps_completed=0,
-            timestamp=datetime.now()
-        )
-        
-    except Exception as e:
-        logger.error(f"Workflow execution failed: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Workflow execution failed: {str(e)}")
+    # Generate workflow ID
+    workflow_id = str(uuid.uuid4())
+    now = datetime.now()
+    
+    # Get or create session
+    if request.session_id:
+        session = await session_manager.get_session(request.session_id)
+        if not session:
+            raise HTTPException(status_code=404, detail="Session not found")
+    else:
+        session = await session_manager.create_session()
+        request.session_id = session.session_id
+    
+    # Validate workflow type
+    if request.workflow_type not in _VALID_WORKFLOWS:
+        raise HTTPException(status_code=400, detail=_INVALID_WORKFLOW_TYPE_DETAIL)
+    
+    # Start workflow execution in background
+    _spawn(agent_manager.execute_workflow(
+        workflow_id,
+        request.workflow_type,
+        request.steps,
+        request.data_source,
+        request.session_id
+    ))
+    
+    logger.info("Started workflow execution", workflow_id=workflow_id, workflow_type=request.workflow_type)
+    
+    # Server-generated values: skip field validation
+    response = WorkflowExecutionResponse.model_construct(
+        workflow_id=workflow_id,
+        workflow_type=request.workflow_type,
+        status="pending",
+        session_id=request.session_id,
+        steps_total=len(request.steps),
+        steps_completed=0,
+        timestamp=now
+    )
+    return ORJSONResponse(response.model_dump())
 
 
 @router.get("/workflow/{workflow_id}")
 async def get_workflow_status(workflow_id: str):
     """Get the status of a workflow execution."""
-    try:
-        status = agent_manager.get_workflow_status(workflow_id)
-        if not status:
-            raise HTTPException(status_code=404, detail="Workflow not found")
-        return status
-    except Exception as e:
-        logger.error(f"Failed to get workflow status: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    status = agent_manager.get_workflow_status(workflow_id)
+    if not status:
+        raise HTTPException(status_code=404, detail="Workflow not found")
+    return ORJSONResponse(status)
 
 
 # Task 52: Add session management for conversations
 @router.post("/session", response_model=SessionResponse)
 async def create_session(request: SessionCreateRequest):
     """Create a new conversation session."""
-    try:
-        session = await session_manager.create_session(
-            user_id=request.user_id,
-            session_name=request.session_name,
-            metadata=request.metadata
-        )
-        
-        logger.info(f"Created new session: {session.session_id}")
-        return session
-        
-    except Exception as e:
-        logger.error(f"Failed to create session: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to create session: {str(e)}")
+    session = await session_manager.create_session(
+        user_id=request.user_id,
+        session_name=request.session_name,
+        metadata=request.metadata
+    )
+    
+    logger.info("Created new session", session_id=session.session_id)
+    return ORJSONResponse(session)
 
 
 @router.get("/session/{session_id}", response_model=SessionResponse)
 async def get_session(session_id: str):
     """Get session details."""
-    try:
-        session = await session_manager.get_session(session_id)
-        if not session:
-            raise HTTPException(status_code=404, detail="Session not found")
-        return session
-    except Exception as e:
-        logger.error(f"Failed to get session: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    session = await session_manager.get_session(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+    return ORJSONResponse(session)
 
 
 @router.get("/sessions", response_model=List[SessionResponse])
 async def list_sessions(user_id: Optional[str] = None, limit: int = 50):
     """List sessions, optionally filtered by user."""
-    try:
-        sessions = await session_manager.list_sessions(user_id=user_id, limit=limit)
-        return sessions
-    except Exception as e:
-        logger.error(f"Failed to list sessions: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    sessions = await session_manager.list_sessions(user_id=user_id, limit=limit)
+    return Response(_SESSIONS_ADAPTER.dump_json(sessions), media_type="application/json")
 
 
 @router.delete("/session/{session_id}")
 async def delete_session(session_id: str):
     """Delete a session and all associated conversations."""
-    try:
-        await session_manager.delete_session(session_id)
-        logger.info(f"Deleted session: {session_id}")
-        return {"message": "Session deleted successfully"}
-    except Exception as e:
-        logger.error(f"Failed to delete session: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    await session_manager.delete_session(session_id)
+    logger.info("Deleted session", session_id=session_id)
+    return {"message": "Session deleted successfully"}
 
 
 # Task 53: Create conversation history storage
-@router.post("/conversation", response_model=ConversationResponse)
-async def create_conversation(request: ConversationRequest):
+@router.post("/conversation", response_model=ConversationResponse, openapi_extra=_json_body(ConversationRequest))
+async def create_conversation(request: ConversationBody = Depends(_body_as(ConversationBody))):
     """Add a message to a conversation and get agent response."""
-    try:
-        # Verify session exists
-        session = await session_manager.get_session(request.session_id)
-        if not session:
-            raise HTTPException(status_code=404, detail="Session not found")
-        
-        # Create conversation entry
-        conversation = await conversation_manager.add_message(
-            session_id=request.session_id,
-            message=request.message,
-            context=request.context
-        )
-        
-        logger.info(f"Added message to conversation: {conversation.conversation_id}")
-        return conversation
-        
-    except Exception as e:
-        logger.error(f"Failed to create conversation: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to create conversation: {str(e)}")
+    # Verify session exists
+    session = await session_manager.get_session(request.session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+    
+    # Create conversation entry
+    conversation = await conversation_manager.add_message(
+        session_id=request.session_id,
+        message=request.message,
+        context=request.context
+    )
+    
+    logger.info("Added message to conversation", conversation_id=conversation.conversation_id)
+    return ORJSONResponse(conversation)
 
 
 @router.get("/conversation/{session_id}/history", response_model=List[ConversationMessage])
@@ -348,28 +452,20 @@ async def get_conversation_history(
     offset: int = 0
 ):
     """Get conversation history for a session."""
-    try:
-        history = await conversation_manager.get_conversation_history(
-            session_id=session_id,
-            limit=limit,
-            offset=offset
-        )
-        return history
-    except Exception as e:
-        logger.error(f"Failed to get conversation history: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    history = await conversation_manager.get_conversation_history(
+        session_id=session_id,
+        limit=limit,
+        offset=offset
+    )
+    return Response(_MESSAGES_ADAPTER.dump_json(history), media_type="application/json")
 
 
 @router.delete("/conversation/{session_id}")
 async def clear_conversation_history(session_id: str):
     """Clear conversation history for a session."""
-    try:
-        await conversation_manager.clear_conversation_history(session_id)
-        logger.info(f"Cleared conversation history for session: {session_id}")
-        return {"message": "Conversation history cleared"}
-    except Exception as e:
-        logger.error(f"Failed to clear conversation history: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    await conversation_manager.clear_conversation_history(session_id)
+    logger.info("Cleared conversation history", session_id=session_id)
+    return {"message": "Conversation history cleared"}
 
 
 # Task 54: Implement real-time status updates
@@ -382,34 +478,24 @@ async def stream_status_updates(session_id: str):
             # Verify session exists
             session = await session_manager.get_session(session_id)
             if not session:
-                yield f"data: {json.dumps({'error': 'Session not found'})}\n\n"
+                yield _SSE_PREFIX + orjson.dumps({'error': 'Session not found'}) + _SSE_SUFFIX
                 return
             
             # Subscribe to status updates for this session
-            async for update in agent_manager.subscribe_to_updates(session_id):
-                # Format as Server-Sent Events
-                status_data = {
-                    "id": update.id,
-                    "type": update.type,
-                    "status": update.status,
-                    "progress": update.progress,
-                    "message": update.message,
-                    "timestamp": update.timestamp.isoformat(),
-                    "metadata": update.metadata
-                }
-                yield f"data: {json.dumps(status_data)}\n\n"
+            async for payload in agent_manager.subscribe_to_updates(session_id):
+                # Updates arrive already JSON-encoded; just add the SSE framing
+                yield _SSE_PREFIX + payload + _SSE_SUFFIX
                 
         except Exception as e:
-            logger.error(f"Status stream error: {str(e)}")
-            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+            logger.error("Status stream error", error=str(e))
+            yield _SSE_PREFIX + orjson.dumps({'error': str(e)}) + _SSE_SUFFIX
     
     return StreamingResponse(
         generate_status_stream(),
-        media_type="text/plain",
+        media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "Content-Type": "text/event-stream"
+            "Connection": "keep-alive"
         }
     )
 
@@ -417,30 +503,30 @@ async def stream_status_updates(session_id: str):
 @router.get("/status/{execution_id}")
 async def get_status_update(execution_id: str):
     """Get current status of an execution or workflow."""
-    try:
-        status = agent_manager.get_status_update(execution_id)
-        if not status:
-            raise HTTPException(status_code=404, detail="Status not found")
-        return status
-    except Exception as e:
-        logger.error(f"Failed to get status update: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    status = agent_manager.get_status_update(execution_id)
+    if not status:
+        raise HTTPException(status_code=404, detail="Status not found")
+    return ORJSONResponse(status)
 
 
 @router.get("/health")
 async def agent_health_check():
     """Health check for agent system."""
+    now = datetime.now()
     try:
         # Check agent manager health
         agent_health = agent_manager.health_check()
-        session_health = await session_manager.health_check()
-        conversation_health = await conversation_manager.health_check()
+        # Run the async component checks concurrently
+        session_health, conversation_health = await asyncio.gather(
+            session_manager.health_check(),
+            conversation_manager.health_check()
+        )
         
         overall_health = all([agent_health, session_health, conversation_health])
         
         return {
             "status": "healthy" if overall_health else "unhealthy",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now,
             "components": {
                 "agent_manager": "healthy" if agent_health else "unhealthy",
                 "session_manager": "healthy" if session_health else "unhealthy", 
@@ -448,11 +534,11 @@ async def agent_health_check():
             }
         }
     except Exception as e:
-        logger.error(f"Agent health check failed: {str(e)}")
+        logger.error("Agent health check failed", error=str(e))
         return {
             "status": "unhealthy",
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now
         }
 
 
@@ -460,13 +546,19 @@ async def agent_health_check():
 async def websocket_status_endpoint(websocket: WebSocket, session_id: str):
     """
     Task 54: Provide real-time status updates via WebSocket.
+
+    Each frame is a JSON array of the updates that arrived within a short
+    coalescing window, so bursts of progress updates share one frame.
     """
     await websocket.accept()
     try:
-        async for update in agent_manager.subscribe_to_updates(session_id):
-            await websocket.send_json(asdict(update))
+        updates = agent_manager.subscribe_to_updates(session_id)
+        async with aclosing(_coalesce(updates, _WS_COALESCE_WINDOW)) as batches:
+            async for batch in batches:
+                # Join the pre-encoded updates into a JSON array; keep text frames for JSON.parse clients
+                await websocket.send_text((b"[" + b",".join(batch) + b"]").decode())
     except WebSocketDisconnect:
-        logger.info(f"WebSocket disconnected for session: {session_id}")
+        logger.info("WebSocket disconnected", session_id=session_id)
     except Exception as e:
-        logger.error(f"WebSocket error for session {session_id}: {e}")
+        logger.error("WebSocket error", session_id=session_id, error=str(e))
         await websocket.close(code=1011)
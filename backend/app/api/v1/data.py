@@ -3,23 +3,57 @@ Data Preview and Analysis API endpoints.
 Implements Tasks 71-80: Data preview, statistics, filtering, and export functionality.
 """
 
-from typing import Optional, List, Dict, Any
-from fastapi import APIRouter, HTTPException, Query, Depends
-from fastapi.responses import JSONResponse
+from typing import Optional, List, Dict, Any, Iterator, Tuple
+from fastapi import APIRouter, HTTPException, Query, Depends, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+from openpyxl import load_workbook
 from pathlib import Path
+from email.utils import formatdate
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
+import asyncio
+import hashlib
 import json
 import logging
+import re
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.services.data_processor import data_processor, DataProfile
+from app.services import file_meta_cache
+from app.services.file_registry import file_registry
 
 logger = get_logger(__name__)
 settings = get_settings()
 
-router = APIRouter(prefix="/api/v1/data", tags=["Data Analysis"])
+router = APIRouter(
+    prefix="/api/v1/data",
+    tags=["Data Analysis"],
+    default_response_class=ORJSONResponse
+)
+
+# Handlers return ORJSONResponse directly so large previews and statistics skip
+# response_model validation; response_model is kept for the OpenAPI schema.
+# Headers set on the injected Response do not apply to a returned response, so
+# cache validators are passed to it explicitly.
+
+# Profiles keyed by (file_id, mtime_ns), evicted least-recently-used first
+PROFILE_CACHE_SIZE = 128
+# Rows serialized per chunk when streaming exports
+EXPORT_CHUNK_ROWS = 10_000
+# One entity tag in an If-None-Match list; quotes keep commas inside a tag intact
+ENTITY_TAG = re.compile(r'(?:W/)?"[^"]*"')
+# Text columns whose sampled distinct ratio is below this are matched per category
+CATEGORY_RATIO = 0.5
+CATEGORY_SAMPLE_SIZE = 1000
+_profile_cache: "OrderedDict[Tuple[str, int], DataProfile]" = OrderedDict()
 
 class DataPreviewResponse(BaseModel):
     file_id: str
@@ -49,6 +83,7 @@ class ColumnAnalysisResponse(BaseModel):
 
 @router.get("/preview/{file_id}", response_model=DataPreviewResponse)
 async def get_data_preview(
+    request: Request,
     file_id: str,
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(50, ge=1, le=1000, description="Number of rows per page"),
@@ -72,56 +107,58 @@ async def get_data_preview(
         if not file_path:
             raise HTTPException(status_code=404, detail="File not found")
         
+        # Short-circuit when the client already has this page
+        cache_headers = _cache_headers(file_path, page, page_size, columns)
+        if _etag_matches(request.headers.get("if-none-match"), cache_headers["ETag"]):
+            return Response(status_code=304, headers=cache_headers)
+        
         # Load data efficiently
         df = await _load_data_for_preview(file_path, page, page_size, columns)
         
         # Get total row count efficiently
-        total_rows = await _get_total_row_count(file_path)
+        total_rows = await asyncio.to_thread(_get_total_row_count, file_path)
         
         # Calculate pagination info
         start_row = (page - 1) * page_size
         end_row = min(start_row + page_size, total_rows)
         has_more = end_row < total_rows
         
-        # Prepare column information
-        column_info = []
-        for col in df.columns:
-            col_info = {
+        # Convert data to JSON-serializable format
+        preview_data = await asyncio.to_thread(_to_records, df)
+        
+        # Prepare column information from one null-count reduction over the frame;
+        # samples come from the serialized rows
+        null_counts = df.isna().sum().to_numpy()
+        column_info = [
+            {
                 "name": col,
-                "type": str(df[col].dtype),
-                "null_count": int(df[col].isnull().sum()),
-                "sample_values": df[col].dropna().head(3).tolist()
+                "type": _dtype_name(dtype),
+                "null_count": int(null_counts[i]),
+                "sample_values": list(islice((row[col] for row in preview_data if row[col] is not None), 3))
             }
-            column_info.append(col_info)
+            for i, (col, dtype) in enumerate(df.dtypes.items())
+        ]
         
-        # Convert data to JSON-serializable format
-        preview_data = []
-        for _, row in df.iterrows():
-            row_dict = {}
-            for col, val in row.items():
-                row_dict[col] = _serialize_value(val)
-            preview_data.append(row_dict)
-        
-        response = DataPreviewResponse(
-            file_id=file_id,
-            filename=file_path.name,
-            total_rows=total_rows,
-            total_columns=len(df.columns),
-            preview_rows=len(preview_data),
-            columns=column_info,
-            data=preview_data,
-            has_more=has_more
-        )
+        preview = {
+            "file_id": file_id,
+            "filename": file_path.name,
+            "total_rows": total_rows,
+            "total_columns": len(df.columns),
+            "preview_rows": len(preview_data),
+            "columns": column_info,
+            "data": preview_data,
+            "has_more": has_more
+        }
         
         logger.info(f"Data preview generated: {len(preview_data)} rows, {len(df.columns)} columns")
-        return response
+        return ORJSONResponse(preview, headers=cache_headers)
         
     except Exception as e:
         logger.error(f"Data preview failed for file_id {file_id}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to generate data preview: {str(e)}")
 
 @router.get("/statistics/{file_id}", response_model=DataStatisticsResponse)
-async def get_data_statistics(file_id: str):
+async def get_data_statistics(file_id: str, request: Request):
     """
     Get comprehensive data statistics and quality metrics.
     
@@ -140,8 +177,13 @@ async def get_data_statistics(file_id: str):
         if not file_path:
             raise HTTPException(status_code=404, detail="File not found")
         
+        # Short-circuit when the client already has these statistics
+        cache_headers = _cache_headers(file_path)
+        if _etag_matches(request.headers.get("if-none-match"), cache_headers["ETag"]):
+            return Response(status_code=304, headers=cache_headers)
+        
         # Process data to get comprehensive profile
-        data_profile = await data_processor.process_file(file_path, file_id)
+        data_profile = await _get_profile(file_path, file_id)
         
         # Overall statistics
         overall_stats = {
@@ -181,17 +223,17 @@ async def get_data_statistics(file_id: str):
             "issues": data_profile.data_issues
         }
         
-        response = DataStatisticsResponse(
-            file_id=file_id,
-            filename=data_profile.filename,
-            overall_stats=overall_stats,
-            column_statistics=column_stats,
-            data_quality=data_quality,
-            recommendations=data_profile.recommendations
-        )
+        statistics = {
+            "file_id": file_id,
+            "filename": data_profile.filename,
+            "overall_stats": overall_stats,
+            "column_statistics": column_stats,
+            "data_quality": data_quality,
+            "recommendations": data_profile.recommendations
+        }
         
         logger.info(f"Data statistics generated for {file_id}. Quality: {data_profile.overall_quality}")
-        return response
+        return ORJSONResponse(statistics, headers=cache_headers)
         
     except Exception as e:
         logger.error(f"Data statistics failed for file_id {file_id}: {str(e)}")
@@ -218,7 +260,7 @@ async def get_column_analysis(file_id: str, column_name: str):
             raise HTTPException(status_code=404, detail="File not found")
         
         # Process data to get profile
-        data_profile = await data_processor.process_file(file_path, file_id)
+        data_profile = await _get_profile(file_path, file_id)
         
         # Find the specific column profile
         column_profile = None
@@ -240,17 +282,17 @@ async def get_column_analysis(file_id: str, column_name: str):
             }
             value_distribution.append(distribution_item)
         
-        response = ColumnAnalysisResponse(
-            column_name=column_profile.name,
-            data_type=column_profile.data_type,
-            statistics=column_profile.statistics,
-            quality_score=column_profile.quality_score,
-            issues=column_profile.quality_issues,
-            value_distribution=value_distribution
-        )
+        analysis = {
+            "column_name": column_profile.name,
+            "data_type": column_profile.data_type,
+            "statistics": column_profile.statistics,
+            "quality_score": column_profile.quality_score,
+            "issues": column_profile.quality_issues,
+            "value_distribution": value_distribution
+        }
         
         logger.info(f"Column analysis completed for {column_name}")
-        return response
+        return ORJSONResponse(analysis)
         
     except Exception as e:
         logger.error(f"Column analysis failed for {file_id}/{column_name}: {str(e)}")
@@ -281,46 +323,53 @@ async def search_data(
         if not file_path:
             raise HTTPException(status_code=404, detail="File not found")
         
-        # Load data
-        df = pd.read_csv(file_path) if file_path.suffix.lower() == '.csv' else pd.read_excel(file_path)
-        
-        # Determine search columns
-        search_columns = df.columns.tolist()
-        if columns:
-            requested_columns = [col.strip() for col in columns.split(',')]
-            search_columns = [col for col in requested_columns if col in df.columns]
-        
-        # Perform search
-        mask = pd.Series([False] * len(df))
-        query_lower = query.lower()
-        
-        for col in search_columns:
-            if df[col].dtype == 'object':  # Text columns
-                col_mask = df[col].astype(str).str.lower().str.contains(query_lower, na=False)
-                mask = mask | col_mask
+        requested_columns = [col.strip() for col in columns.split(',')] if columns else None
         
-        # Apply mask and limit results
-        results_df = df[mask].head(limit)
+        csv_search = None
+        if file_path.suffix.lower() == '.csv':
+            # Stream the CSV through Arrow with the match pushed into the scan
+            csv_search = await asyncio.to_thread(
+                _search_csv, file_path, query, requested_columns, limit
+            )
+        if csv_search is not None:
+            search_columns, results_df, total_matches = csv_search
+        else:
+            # Load data off the event loop (cached per file modification time)
+            df = await asyncio.to_thread(file_meta_cache.get_frame, file_path)
+            
+            # Determine search columns
+            search_columns = df.columns.tolist()
+            if requested_columns:
+                search_columns = [col for col in requested_columns if col in df.columns]
+            
+            # Perform search
+            # Match text columns concurrently on the default executor; the Arrow kernel
+            # releases the GIL, so wide frames scale with the available cores
+            masks = await asyncio.gather(*(
+                asyncio.to_thread(_contains_mask, df[col], query)
+                for col in search_columns
+                if df[col].dtype == 'object'  # Text columns
+            ))
+            mask = np.logical_or.reduce(masks) if masks else np.zeros(len(df), dtype=bool)
+            
+            # Apply mask and limit results, copying only the rows returned
+            results_df = df.iloc[np.flatnonzero(mask)[:limit]]
+            total_matches = int(mask.sum())
         
         # Convert to JSON-serializable format
-        results = []
-        for _, row in results_df.iterrows():
-            row_dict = {}
-            for col, val in row.items():
-                row_dict[col] = _serialize_value(val)
-            results.append(row_dict)
+        results = await asyncio.to_thread(_to_records, results_df)
         
         response = {
             "file_id": file_id,
             "query": query,
             "search_columns": search_columns,
-            "total_matches": int(mask.sum()),
+            "total_matches": total_matches,
             "returned_results": len(results),
             "results": results
         }
         
-        logger.info(f"Search completed: {mask.sum()} matches found, {len(results)} returned")
-        return response
+        logger.info(f"Search completed: {total_matches} matches found, {len(results)} returned")
+        return ORJSONResponse(response)
         
     except Exception as e:
         logger.error(f"Data search failed for file_id {file_id}: {str(e)}")
@@ -351,58 +400,47 @@ async def export_data(
         if not file_path:
             raise HTTPException(status_code=404, detail="File not found")
         
-        # Load data
-        df = pd.read_csv(file_path) if file_path.suffix.lower() == '.csv' else pd.read_excel(file_path)
-        
-        # Apply column selection
+        # Load data off the event loop, parsing only the selected columns
         if columns:
             requested_columns = [col.strip() for col in columns.split(',')]
-            available_columns = [col for col in requested_columns if col in df.columns]
-            if available_columns:
-                df = df[available_columns]
+            df = await asyncio.to_thread(file_meta_cache.get_columns, file_path, requested_columns)
+        else:
+            df = await asyncio.to_thread(file_meta_cache.get_frame, file_path)
         
         # Apply filters (basic implementation)
         if filters:
             try:
                 filter_dict = json.loads(filters)
-                for col, value in filter_dict.items():
-                    if col in df.columns:
-                        if isinstance(value, list):
-                            df = df[df[col].isin(value)]
-                        else:
-                            df = df[df[col] == value]
+                df = await asyncio.to_thread(_apply_filters, df, filter_dict)
             except Exception as filter_error:
                 logger.warning(f"Filter application failed: {filter_error}")
         
         # Export based on format
         export_filename = f"{file_id}_export"
         
-        if format.lower() == "csv":
-            export_data = df.to_csv(index=False)
-            media_type = "text/csv"
-            export_filename += ".csv"
-        elif format.lower() == "json":
-            export_data = df.to_json(orient='records', indent=2)
-            media_type = "application/json"
-            export_filename += ".json"
-        elif format.lower() == "excel":
+        if format.lower() in ("csv", "excel"):
             # For Excel, we'd need to use BytesIO, but for simplicity, convert to CSV
-            export_data = df.to_csv(index=False)
+            chunks = _csv_chunks(df)
             media_type = "text/csv"
             export_filename += ".csv"
+        elif format.lower() == "json":
+            # Newline-delimited records so the body can be written chunk by chunk
+            chunks = _ndjson_chunks(df)
+            media_type = "application/x-ndjson"
+            export_filename += ".ndjson"
         else:
             raise HTTPException(status_code=400, detail="Unsupported export format")
         
-        logger.info(f"Data export completed: {len(df)} rows, {len(df.columns)} columns")
+        logger.info(f"Data export streaming: {len(df)} rows, {len(df.columns)} columns")
         
-        return JSONResponse(
-            content={
-                "file_id": file_id,
-                "export_format": format,
-                "row_count": len(df),
-                "column_count": len(df.columns),
-                "filename": export_filename,
-                "data": export_data
+        # Sync generators are iterated in the threadpool, keeping serialization off the loop
+        return StreamingResponse(
+            chunks,
+            media_type=media_type,
+            headers={
+                "Content-Disposition": f'attachment; filename="{export_filename}"',
+                "X-Row-Count": str(len(df)),
+                "X-Column-Count": str(len(df.columns)),
             }
         )
         
@@ -412,18 +450,34 @@ async def export_data(
 
 # Helper functions
 
+def _apply_filters(df: pd.DataFrame, filter_dict: Dict[str, Any]) -> pd.DataFrame:
+    """Keep rows matching every column filter; list values match any of their items."""
+    # Combine every condition into one mask so the frame is sliced once; nulls in
+    # Arrow-backed columns compare as NA, which never matches
+    masks = [
+        (df[col].isin(value) if isinstance(value, list) else df[col] == value).to_numpy(dtype=bool, na_value=False)
+        for col, value in filter_dict.items()
+        if col in df.columns
+    ]
+    if masks:
+        df = df.loc[np.logical_and.reduce(masks)]
+    return df
+
+def _csv_chunks(df: pd.DataFrame) -> Iterator[str]:
+    """Yield a DataFrame as CSV text, header first, EXPORT_CHUNK_ROWS rows at a time."""
+    yield df.iloc[:0].to_csv(index=False)
+    for start in range(0, len(df), EXPORT_CHUNK_ROWS):
+        yield df.iloc[start:start + EXPORT_CHUNK_ROWS].to_csv(index=False, header=False)
+
+def _ndjson_chunks(df: pd.DataFrame) -> Iterator[str]:
+    """Yield a DataFrame as newline-delimited JSON records, EXPORT_CHUNK_ROWS rows at a time."""
+    for start in range(0, len(df), EXPORT_CHUNK_ROWS):
+        chunk = df.iloc[start:start + EXPORT_CHUNK_ROWS].to_json(orient='records', lines=True)
+        yield chunk if chunk.endswith('\n') else chunk + '\n'
+
 async def _find_file_by_id(file_id: str) -> Optional[Path]:
     """Find uploaded file by ID."""
-    upload_dir = Path(settings.UPLOAD_DIR)
-    
-    # Search through upload sessions
-    for session_dir in upload_dir.iterdir():
-        if session_dir.is_dir():
-            for file_path in session_dir.iterdir():
-                if file_path.name.startswith(file_id):
-                    return file_path
-    
-    return None
+    return file_registry.find(file_id, Path(settings.UPLOAD_DIR))
 
 async def _load_data_for_preview(file_path: Path, page: int, page_size: int, columns: Optional[str]) -> pd.DataFrame:
     """Load data efficiently for preview with pagination."""
@@ -434,49 +488,244 @@ async def _load_data_for_preview(file_path: Path, page: int, page_size: int, col
     if columns:
         selected_columns = [col.strip() for col in columns.split(',')]
     
-    if file_path.suffix.lower() == '.csv':
-        df = pd.read_csv(
-            file_path, 
-            skiprows=range(1, skip_rows + 1) if skip_rows > 0 else None,
-            nrows=page_size,
-            usecols=selected_columns,
-            low_memory=False
-        )
-    else:
-        # For Excel files, load all then slice (less efficient but simpler)
-        full_df = pd.read_excel(file_path, usecols=selected_columns)
-        end_row = skip_rows + page_size
-        df = full_df.iloc[skip_rows:end_row]
+    is_csv = file_path.suffix.lower() == '.csv'
+    if is_csv and await asyncio.to_thread(file_meta_cache.get_cached_frame, file_path) is None:
+        # Parse just this page rather than the whole file
+        page_df = await asyncio.to_thread(_read_csv_page, file_path, skip_rows, page_size, selected_columns)
+        if page_df is not None:
+            return page_df
     
-    return df
+    # Slice the shared parsed frame; Excel has to be read in full anyway
+    full_df = await asyncio.to_thread(file_meta_cache.get_frame, file_path)
+    if selected_columns:
+        full_df = full_df[[col for col in selected_columns if col in full_df.columns]]
+    end_row = skip_rows + page_size
+    return full_df.iloc[skip_rows:end_row]
+
+def _read_csv_page(
+    file_path: Path,
+    skip_rows: int,
+    page_size: int,
+    selected_columns: Optional[List[str]]
+) -> Optional[pd.DataFrame]:
+    """
+    Read one page of a CSV by streaming Arrow record batches past the skipped rows.
+    Blocking - call through asyncio.to_thread.
+    
+    Unknown selected columns are ignored, as for cached frames. The streaming
+    reader fixes column types from the first block, so returns None when a later
+    block contradicts them; the caller falls back to the full-file parse.
+    """
+    try:
+        return _stream_csv_page(file_path, skip_rows, page_size, selected_columns)
+    except pa.ArrowInvalid:
+        return None
+
+def _stream_csv_page(
+    file_path: Path,
+    skip_rows: int,
+    page_size: int,
+    selected_columns: Optional[List[str]]
+) -> pd.DataFrame:
+    """Stream the batches of one page of a CSV. Raises pa.ArrowInvalid on type conflicts."""
+    with pa.memory_map(str(file_path)) as source:
+        reader = file_meta_cache.open_csv(source)
+        kept = []
+        kept_rows = 0
+        seen = 0
+        for batch in reader:
+            if seen + batch.num_rows <= skip_rows:
+                seen += batch.num_rows
+                continue
+            batch = batch.slice(max(skip_rows - seen, 0), page_size - kept_rows)
+            seen = skip_rows
+            kept.append(batch)
+            kept_rows += batch.num_rows
+            if kept_rows >= page_size:
+                break
+        table = pa.Table.from_batches(kept, schema=reader.schema)
+    
+    if selected_columns:
+        table = table.select([col for col in selected_columns if col in table.column_names])
+    return file_meta_cache.table_to_frame(table)
 
-async def _get_total_row_count(file_path: Path) -> int:
-    """Get total row count efficiently."""
+async def _get_profile(file_path: Path, file_id: str) -> DataProfile:
+    """Get the data profile for a file, profiling each file version at most once."""
+    key = (file_id, file_path.stat().st_mtime_ns)
+    profile = _profile_cache.get(key)
+    if profile is not None:
+        _profile_cache.move_to_end(key)
+        return profile
+    
+    # Reading and profiling are CPU-bound pandas work; keep them off the event loop
+    profile = await data_processor.process_file_isolated(file_path, file_id)
+    _profile_cache[key] = profile
+    while len(_profile_cache) > PROFILE_CACHE_SIZE:
+        _profile_cache.popitem(last=False)
+    return profile
+
+def _search_csv(
+    file_path: Path,
+    query: str,
+    requested_columns: Optional[List[str]],
+    limit: int
+) -> Optional[Tuple[List[str], pd.DataFrame, int]]:
+    """
+    Case-insensitive substring search over a CSV's text columns with a streaming Arrow scan.
+    Blocking - call through asyncio.to_thread.
+    
+    Returns the searched columns, the first `limit` matching rows and the total match count,
+    or None when a later block contradicts the column types inferred from the first; a
+    column read as numeric would otherwise fail the scan or skip the text pandas sees.
+    """
     try:
-        if file_path.suffix.lower() == '.csv':
-            # Count lines in CSV (subtract 1 for header)
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return sum(1 for line in f) - 1
-        else:
-            # For Excel, we need to load to count
-            df = pd.read_excel(file_path, usecols=[0])  # Load only first column
-            return len(df)
+        return _scan_csv(file_path, query, requested_columns, limit)
+    except pa.ArrowInvalid:
+        return None
+
+def _scan_csv(
+    file_path: Path,
+    query: str,
+    requested_columns: Optional[List[str]],
+    limit: int
+) -> Tuple[List[str], pd.DataFrame, int]:
+    """Run the filtered dataset scan for _search_csv. Raises pa.ArrowInvalid on type conflicts."""
+    dataset = file_meta_cache.csv_dataset(file_path)
+    schema = dataset.schema
+    
+    search_columns = schema.names
+    if requested_columns:
+        search_columns = [col for col in requested_columns if col in schema.names]
+    
+    # Only string columns are searched, matching the object-dtype columns pandas would give
+    expr = None
+    for col in search_columns:
+        if pa.types.is_string(schema.field(col).type) or pa.types.is_large_string(schema.field(col).type):
+            col_expr = pc.match_substring(ds.field(col), query, ignore_case=True)
+            expr = col_expr if expr is None else expr | col_expr
+    
+    if expr is None:
+        return search_columns, file_meta_cache.table_to_frame(schema.empty_table()), 0
+    
+    # One pass: count every match but keep only the first `limit` rows
+    total_matches = 0
+    kept = []
+    kept_rows = 0
+    scanner = dataset.scanner(filter=expr)
+    for batch in scanner.to_batches():
+        total_matches += batch.num_rows
+        if kept_rows < limit and batch.num_rows:
+            batch = batch.slice(0, limit - kept_rows)
+            kept.append(batch)
+            kept_rows += batch.num_rows
+    
+    table = pa.Table.from_batches(kept, schema=scanner.projected_schema)
+    return search_columns, file_meta_cache.table_to_frame(table), total_matches
+
+def _contains_mask(series: pd.Series, query: str) -> np.ndarray:
+    """
+    Match a substring against a text column.
+    
+    Low-cardinality columns are factorized so the match runs once per distinct
+    value and is mapped back through the codes, as a categorical dtype would.
+    Other columns use Arrow's substring kernel, which runs without the GIL.
+    """
+    sample = series.iloc[:CATEGORY_SAMPLE_SIZE]
+    if len(sample) and sample.nunique() >= len(sample) * CATEGORY_RATIO:
+        try:
+            values = pa.array(series, type=pa.string(), from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Mixed-type object column: only then pay for a string copy
+            values = pa.array(series.astype(str), type=pa.string())
+        matches = pc.match_substring(values, query, ignore_case=True)
+        return matches.fill_null(False).to_numpy(zero_copy_only=False)
+    
+    codes, categories = pd.factorize(series)
+    hits = pd.Index(categories).astype(str).str.contains(query, case=False, regex=False)
+    # Nulls are coded -1, which indexes the trailing False
+    return np.append(hits, False)[codes]
+
+def _get_total_row_count(file_path: Path) -> int:
+    """Get total row count efficiently. Blocking - call through asyncio.to_thread."""
+    try:
+        stat = file_path.stat()
+        return _row_count(file_path, stat.st_mtime_ns, stat.st_size)
     except Exception:
         return 0
 
-def _serialize_value(value):
-    """Serialize value for JSON compatibility."""
-    import pandas as pd
-    import numpy as np
-    from datetime import datetime
-    
-    if pd.isna(value):
-        return None
-    elif isinstance(value, (np.integer, int)):
-        return int(value)
-    elif isinstance(value, (np.floating, float)):
-        return float(value)
-    elif isinstance(value, (pd.Timestamp, datetime)):
-        return value.isoformat()
-    else:
-        return str(value)
+@lru_cache(maxsize=128)
+def _row_count(file_path: Path, mtime_ns: int, size: int) -> int:
+    """Count rows for one version of a file; the stat fields key the cache."""
+    if file_path.suffix.lower() == '.csv':
+        # Count newlines in CSV (subtract 1 for header)
+        return max(_count_lines(file_path) - 1, 0)
+    elif file_path.suffix.lower() == '.xlsx':
+        # Read the sheet dimension from its XML metadata instead of parsing rows
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            # pd.read_excel reads the first sheet, which need not be the active one
+            max_row = workbook.worksheets[0].max_row
+        finally:
+            workbook.close()
+        if max_row:
+            return max(max_row - 1, 0)
+
+    # Legacy .xls or a sheet without a stored dimension: load the first column to count
+    df = pd.read_excel(file_path, usecols=[0])
+    return len(df)
+
+def _cache_headers(file_path: Path, *params) -> Dict[str, str]:
+    """Build validator headers from file modification time, size and request params."""
+    stat = file_path.stat()
+    digest = hashlib.blake2b(
+        f"{stat.st_mtime_ns}:{stat.st_size}:{params}".encode(),
+        digest_size=8
+    ).hexdigest()
+    return {
+        "ETag": f'W/"{digest}"',
+        "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+        "Cache-Control": "private, max-age=2"
+    }
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Evaluate If-None-Match against an ETag: any listed tag or "*" matches.
+    Uses the weak comparison RFC 9110 requires here, so W/ prefixes are ignored.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.removeprefix("W/") == opaque for tag in ENTITY_TAG.findall(if_none_match))
+
+def _count_lines(file_path: Path) -> int:
+    """Count lines by scanning raw bytes in 1MB blocks without decoding."""
+    lines = 0
+    last_block = b""
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            lines += block.count(b"\n")
+            last_block = block
+    # Count a final line that has no trailing newline
+    if last_block and not last_block.endswith(b"\n"):
+        lines += 1
+    return lines
+
+def _dtype_name(dtype) -> str:
+    """Report Arrow-backed dtypes by their NumPy equivalent, as the cached frames use."""
+    if isinstance(dtype, pd.ArrowDtype):
+        if pa.types.is_string(dtype.pyarrow_dtype) or pa.types.is_large_string(dtype.pyarrow_dtype):
+            return "object"
+        return str(dtype.numpy_dtype)
+    return str(dtype)
+
+def _to_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Convert a DataFrame to JSON-serializable records with column-wise conversions."""
+    records = df.astype(object)
+    for col in df.select_dtypes(include=["datetime", "datetimetz"]).columns:
+        # isoformat keeps fractional seconds and offsets, as data_processor's profiles do
+        records[col] = df[col].map(pd.Timestamp.isoformat, na_action="ignore")
+    for col in df.select_dtypes(exclude=["number", "bool", "datetime", "datetimetz"]).columns:
+        records[col] = df[col].astype(str)
+    return records.where(df.notna(), None).to_dict(orient="records")
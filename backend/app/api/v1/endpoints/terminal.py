@@ -4,17 +4,35 @@ Provides REST API access to terminal monitoring and status information
 """
 
 from fastapi import APIRouter, HTTPException, BackgroundTasks
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 import asyncio
+import time
 from datetime import datetime, timezone
 
-from app.utils.terminal_monitor import terminal_monitor, get_terminal_status
+from app.utils.terminal_monitor import terminal_monitor, TerminalMonitorData
 from app.core.logging import get_logger
 
 logger = get_logger("terminal_api")
 
 router = APIRouter()
 
+# A probe samples CPU for a second and walks processes, ports and log files, so
+# polls within the TTL share one snapshot
+STATUS_TTL_SECONDS = 1.0
+_last_status: Optional[Tuple[float, TerminalMonitorData]] = None
+_status_lock = asyncio.Lock()
+
+
+async def _snapshot() -> TerminalMonitorData:
+    """Return the current terminal status, probing at most once per TTL."""
+    global _last_status
+    async with _status_lock:
+        if _last_status and time.monotonic() - _last_status[0] < STATUS_TTL_SECONDS:
+            return _last_status[1]
+        status_data = await asyncio.to_thread(terminal_monitor.collect_terminal_status)
+        _last_status = (time.monotonic(), status_data)
+        return status_data
+
 
 @router.get("/status", summary="Get Terminal Status")
 async def get_current_terminal_status() -> Dict[str, Any]:
@@ -25,7 +43,7 @@ async def get_current_terminal_status() -> Dict[str, Any]:
         Dict containing backend status, system info, ports, and logs
     """
     try:
-        status = get_terminal_status()
+        status = terminal_monitor.get_status_report(await _snapshot())
         logger.info("Terminal status requested via API")
         return {
             "success": True,
@@ -46,7 +64,7 @@ async def get_backend_status() -> Dict[str, Any]:
         Dict containing backend process details
     """
     try:
-        status_data = terminal_monitor.collect_terminal_status()
+        status_data = await _snapshot()
         
         backend_info = {
             "status": status_data.backend_status.value,
@@ -88,14 +106,15 @@ async def get_system_status() -> Dict[str, Any]:
         Dict containing CPU, memory, and disk usage
     """
     try:
-        system_info = terminal_monitor.get_system_info()
+        status_data = await _snapshot()
+        system_info = status_data.system_info
         
         logger.info("System status requested via API")
         
         return {
             "success": True,
             "data": system_info,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": status_data.timestamp.isoformat()
         }
         
     except Exception as e:
@@ -112,14 +131,15 @@ async def get_logs_summary() -> Dict[str, Any]:
         Dict containing log file information
     """
     try:
-        log_summary = terminal_monitor.get_log_summary()
+        status_data = await _snapshot()
+        log_summary = status_data.log_summary
         
         logger.info("Logs summary requested via API")
         
         return {
             "success": True,
             "data": log_summary,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": status_data.timestamp.isoformat()
         }
         
     except Exception as e:
@@ -167,14 +187,17 @@ async def refresh_terminal_status() -> Dict[str, Any]:
         Updated status information
     """
     try:
-        status_data = terminal_monitor.log_terminal_status()
+        global _last_status
+        status_data = await asyncio.to_thread(terminal_monitor.log_terminal_status)
+        # A forced refresh also serves the next polls
+        _last_status = (time.monotonic(), status_data)
         
         logger.info("Terminal status manually refreshed")
         
         return {
             "success": True,
             "message": "Status refreshed successfully",
-            "data": terminal_monitor.get_status_report(),
+            "data": terminal_monitor.get_status_report(status_data),
             "timestamp": status_data.timestamp.isoformat()
         }
         
@@ -193,7 +216,7 @@ async def health_check() -> Dict[str, Any]:
     """
     try:
         # Quick status check
-        status_data = terminal_monitor.collect_terminal_status()
+        status_data = await _snapshot()
         
         is_healthy = (
             status_data.backend_status.value in ["running", "starting"] and
@@ -3,20 +3,21 @@ Enterprise Insights Copilot - Health Check Endpoints
 MAANG-level health monitoring and readiness checks
 """
 
-from fastapi import APIRouter, HTTPException, Depends
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Depends, Response
 from pydantic import BaseModel
-from typing import Dict, Any, List
-from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Tuple
 import asyncio
+import itertools
 import time
 import os
-import psutil
+import orjson
 from pathlib import Path
 
 from app.core.config import settings
 from app.core.logging import get_logger
 from app.core.environment import env_config
+from app.core import readiness_state, resource_cache
+from app.middleware.health_interceptor import liveness_body, utc_timestamp
 
 logger = get_logger(__name__)
 router = APIRouter()
@@ -49,8 +50,35 @@ class LivenessStatus(BaseModel):
     environment: str
 
 
-# Global startup time for uptime calculation
-startup_time = time.time()
+# Global startup time for uptime calculation; monotonic so clock steps don't skew it
+startup_ns = time.monotonic_ns()
+
+# Healthy probe outcomes are logged once per PROBE_LOG_SAMPLE_RATE calls
+PROBE_LOG_SAMPLE_RATE = 100
+_health_probes = itertools.count()
+_readiness_probes = itertools.count()
+
+# Readiness results are shared between probes for a short TTL: (deadline, ready, checks)
+READINESS_TTL_SECONDS = 1.5
+_readiness: Optional[Tuple[float, bool, Dict[str, Any]]] = None
+_readiness_lock = asyncio.Lock()
+
+# Last file system probe: (monotonic time, result)
+FILE_SYSTEM_REFRESH_SECONDS = 60.0
+_file_system: Optional[Tuple[float, Dict[str, Any]]] = None
+
+# Fields shared by every health payload, serialized once at import. Settings are
+# not reloaded at runtime; anything that changes them must rebuild this prefix
+_STATIC_PREFIX = orjson.dumps({
+    "version": settings.VERSION,
+    "environment": settings.ENVIRONMENT,
+})[:-1]
+
+
+def _health_response(fields: Dict[str, Any], status_code: int = 200) -> Response:
+    """Build a JSON response from per-request fields spliced after the static prefix"""
+    body = _STATIC_PREFIX + b"," + orjson.dumps(fields)[1:]
+    return Response(content=body, status_code=status_code, media_type="application/json")
 
 
 async def check_database() -> Dict[str, Any]:
@@ -91,7 +119,7 @@ async def check_redis() -> Dict[str, Any]:
         }
 
 
-async def check_external_apis() -> Dict[str, Any]:
+def _external_api_checks() -> Dict[str, Any]:
     """Check external API dependencies"""
     try:
         checks = {}
@@ -142,19 +170,23 @@ async def check_external_apis() -> Dict[str, Any]:
         }
 
 
+# API key configuration only depends on settings, so it is checked once at import
+_EXTERNAL_API_CHECKS = _external_api_checks()
+
+
+async def check_external_apis() -> Dict[str, Any]:
+    """Check external API dependencies"""
+    return _EXTERNAL_API_CHECKS
+
+
 def check_system_resources() -> Dict[str, Any]:
     """Check system resource usage"""
     try:
-        # CPU usage
-        cpu_percent = psutil.cpu_percent(interval=1)
-        
-        # Memory usage
-        memory = psutil.virtual_memory()
-        memory_percent = memory.percent
-        
-        # Disk usage
-        disk = psutil.disk_usage('/')
-        disk_percent = (disk.used / disk.total) * 100
+        # Usage is sampled in the background; no psutil calls on the request path
+        snapshot = resource_cache.get_snapshot()
+        cpu_percent = snapshot.cpu_percent
+        memory_percent = snapshot.memory_percent
+        disk_percent = snapshot.disk_percent
         
         # Determine overall status
         status = "healthy"
@@ -190,6 +222,18 @@ def check_system_resources() -> Dict[str, Any]:
 
 
 def check_file_system() -> Dict[str, Any]:
+    """
+    Check file system health from a cached probe.
+    The directory layout is fixed at startup, so the probe is only repeated
+    every FILE_SYSTEM_REFRESH_SECONDS in case a mounted volume changes.
+    """
+    global _file_system
+    if _file_system is None or time.monotonic() - _file_system[0] >= FILE_SYSTEM_REFRESH_SECONDS:
+        _file_system = (time.monotonic(), _probe_file_system())
+    return _file_system[1]
+
+
+def _probe_file_system() -> Dict[str, Any]:
     """Check file system health"""
     try:
         checks = {}
@@ -235,24 +279,44 @@ def check_file_system() -> Dict[str, Any]:
         }
 
 
-@router.get("/health/", response_model=HealthStatus)
+def _check_result(result: Any) -> Dict[str, Any]:
+    """Turn an exception raised by a gathered check into an unhealthy result"""
+    if isinstance(result, Exception):
+        return {
+            "status": "unhealthy",
+            "error": str(result),
+            "message": "Health check raised an exception"
+        }
+    return result
+
+
+@router.get("/health/", responses={200: {"model": HealthStatus}})
 async def health_check():
     """
     Comprehensive health check endpoint
     Returns detailed health information about all system components
     """
-    start_time = time.time()
-    timestamp = datetime.utcnow().isoformat() + "Z"
-    uptime = time.time() - startup_time
+    start_ns = time.monotonic_ns()
+    timestamp = utc_timestamp()
+    uptime = (start_ns - startup_ns) / 1e9
     
     try:
-        # Run all health checks
+        # Run the checks concurrently so latency is the slowest, not the sum; the
+        # sync probes touch psutil and the disk, so they run in the threadpool
+        database, redis, external_apis, system_resources, file_system = await asyncio.gather(
+            check_database(),
+            check_redis(),
+            check_external_apis(),
+            asyncio.to_thread(check_system_resources),
+            asyncio.to_thread(check_file_system),
+            return_exceptions=True
+        )
         checks = {
-            "database": await check_database(),
-            "redis": await check_redis(),
-            "external_apis": await check_external_apis(),
-            "system_resources": check_system_resources(),
-            "file_system": check_file_system(),
+            "database": _check_result(database),
+            "redis": _check_result(redis),
+            "external_apis": _check_result(external_apis),
+            "system_resources": _check_result(system_resources),
+            "file_system": _check_result(file_system),
         }
         
         # Determine overall status
@@ -265,132 +329,157 @@ async def health_check():
                 elif check_result.get("status") == "warning" and overall_status == "healthy":
                     overall_status = "warning"
         
-        # Log health check
-        duration = (time.time() - start_time) * 1000
-        logger.info(
-            "Health check completed",
-            status=overall_status,
-            duration_ms=round(duration, 2),
-            uptime_seconds=round(uptime, 2)
-        )
+        # Log health check: every degraded result, but only a sample of healthy probes
+        if overall_status != "healthy" or next(_health_probes) % PROBE_LOG_SAMPLE_RATE == 0:
+            duration = (time.monotonic_ns() - start_ns) / 1e6
+            logger.info(
+                "Health check completed",
+                status=overall_status,
+                duration_ms=round(duration, 2),
+                uptime_seconds=round(uptime, 2)
+            )
         
-        return HealthStatus(
-            status=overall_status,
-            timestamp=timestamp,
-            version=settings.VERSION,
-            environment=settings.ENVIRONMENT,
-            uptime=round(uptime, 2),
-            checks=checks
-        )
+        return _health_response({
+            "status": overall_status,
+            "timestamp": timestamp,
+            "uptime": round(uptime, 2),
+            "checks": checks
+        })
         
     except Exception as e:
         logger.error("Health check failed", error=str(e), exc_info=True)
-        return JSONResponse(
-            status_code=503,
-            content={
-                "status": "unhealthy",
-                "timestamp": timestamp,
-                "version": settings.VERSION,
-                "environment": settings.ENVIRONMENT,
-                "error": str(e),
-                "message": "Health check failed"
-            }
+        return _health_response({
+            "status": "unhealthy",
+            "timestamp": timestamp,
+            "error": str(e),
+            "message": "Health check failed"
+        }, status_code=503)
+
+
+async def run_readiness_checks() -> Tuple[bool, Dict[str, Any]]:
+    """Check critical dependencies and decide readiness; run by readiness_state's refresher"""
+    database, redis = await asyncio.gather(
+        check_database(),
+        check_redis(),
+        return_exceptions=True
+    )
+    checks = {
+        "database": _check_result(database),
+        "redis": _check_result(redis),
+        "configuration": {
+            "status": "healthy" if settings.SECRET_KEY != "your-super-secret-key-change-in-production" else "warning",
+            "message": "Configuration loaded"
+        }
+    }
+    
+    # Determine readiness
+    ready = True
+    for check_name, check_result in checks.items():
+        if isinstance(check_result, dict) and check_result.get("status") == "unhealthy":
+            ready = False
+            break
+    
+    # The checks are only worth logging when they explain a failure
+    if not ready:
+        logger.info(
+            "Readiness check completed",
+            ready=ready,
+            checks=checks
         )
+    elif next(_readiness_probes) % PROBE_LOG_SAMPLE_RATE == 0:
+        logger.info("Readiness check completed", ready=ready)
+    return ready, checks
+
+
+async def _cached_readiness() -> Tuple[bool, Dict[str, Any]]:
+    """
+    Return the readiness result, re-running the checks at most once per TTL.
+    Concurrent probes after expiry wait for the single in-flight run.
+    """
+    global _readiness
+    if _readiness and time.monotonic() < _readiness[0]:
+        return _readiness[1], _readiness[2]
+    async with _readiness_lock:
+        # Another probe may have refreshed the result while we waited
+        if _readiness and time.monotonic() < _readiness[0]:
+            return _readiness[1], _readiness[2]
+        try:
+            ready, checks = await asyncio.wait_for(
+                run_readiness_checks(), readiness_state.CHECK_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            ready, checks = False, {"message": "Readiness check timed out"}
+        _readiness = (time.monotonic() + READINESS_TTL_SECONDS, ready, checks)
+        return ready, checks
+
+
+def get_cached_readiness() -> Optional[bool]:
+    """Last readiness outcome for other components, or None if never checked or expired"""
+    state = readiness_state.get_state()
+    if state is not None:
+        return state.ready
+    if _readiness and time.monotonic() < _readiness[0]:
+        return _readiness[1]
+    return None
 
 
-@router.get("/readiness", response_model=ReadinessStatus)
+@router.get("/readiness", responses={200: {"model": ReadinessStatus}})
 async def readiness_check():
     """
     Readiness check endpoint for Kubernetes
     Determines if the application is ready to accept traffic
     """
-    timestamp = datetime.utcnow().isoformat() + "Z"
+    timestamp = utc_timestamp()
     
     try:
-        # Check critical dependencies for readiness
-        checks = {
-            "database": await check_database(),
-            "redis": await check_redis(),
-            "configuration": {
-                "status": "healthy" if settings.SECRET_KEY != "your-super-secret-key-change-in-production" else "warning",
-                "message": "Configuration loaded"
-            }
-        }
-        
-        # Determine readiness
-        ready = True
-        for check_name, check_result in checks.items():
-            if isinstance(check_result, dict) and check_result.get("status") == "unhealthy":
-                ready = False
-                break
-        
+        # Normally a memory read: the background refresher keeps the state current.
+        # Without it (e.g. the app was not started, or the refresher is stuck and its
+        # state has gone stale), probes share a short-lived result
+        state = readiness_state.get_state()
+        if state is not None:
+            ready, checks = state.ready, state.checks
+        else:
+            ready, checks = await _cached_readiness()
         status_code = 200 if ready else 503
         
-        logger.info(
-            "Readiness check completed",
-            ready=ready,
-            checks=checks
-        )
-        
-        response = ReadinessStatus(
-            ready=ready,
-            timestamp=timestamp,
-            version=settings.VERSION,
-            environment=settings.ENVIRONMENT,
-            checks=checks
-        )
-        
-        return JSONResponse(
-            status_code=status_code,
-            content=response.dict()
-        )
+        return _health_response({
+            "ready": ready,
+            "timestamp": timestamp,
+            "checks": checks
+        }, status_code=status_code)
         
     except Exception as e:
         logger.error("Readiness check failed", error=str(e), exc_info=True)
-        return JSONResponse(
-            status_code=503,
-            content={
-                "ready": False,
-                "timestamp": timestamp,
-                "version": settings.VERSION,
-                "environment": settings.ENVIRONMENT,
-                "error": str(e),
-                "message": "Readiness check failed"
-            }
-        )
+        return _health_response({
+            "ready": False,
+            "timestamp": timestamp,
+            "error": str(e),
+            "message": "Readiness check failed"
+        }, status_code=503)
 
 
-@router.get("/liveness", response_model=LivenessStatus)
+@router.get("/liveness", responses={200: {"model": LivenessStatus}})
 async def liveness_check():
     """
     Liveness check endpoint for Kubernetes
     Simple check to determine if the application is alive
+    
+    Probes are answered by HealthCheckInterceptor before reaching the router;
+    this route documents the endpoint and serves apps mounted without it.
     """
-    timestamp = datetime.utcnow().isoformat() + "Z"
+    timestamp = utc_timestamp()
     
     try:
         # Simple liveness check - if we can respond, we're alive
-        response = LivenessStatus(
-            alive=True,
-            timestamp=timestamp,
-            version=settings.VERSION,
-            environment=settings.ENVIRONMENT
-        )
-        
-        return response
+        return Response(content=liveness_body(), media_type="application/json")
         
     except Exception as e:
         logger.error("Liveness check failed", error=str(e), exc_info=True)
-        return JSONResponse(
-            status_code=503,
-            content={
-                "alive": False,
-                "timestamp": timestamp,
-                "version": settings.VERSION,
-                "environment": settings.ENVIRONMENT,
-                "error": str(e)
-            }
-        )
+        return _health_response({
+            "alive": False,
+            "timestamp": timestamp,
+            "error": str(e)
+        }, status_code=503)
 
 
 @router.get("/metrics")
@@ -398,14 +487,10 @@ async def metrics():
     """
     Basic metrics endpoint for monitoring
     """
-    uptime = time.time() - startup_time
+    uptime = (time.monotonic_ns() - startup_ns) / 1e9
     
     # TODO: Implement Prometheus metrics
-    metrics_data = {
+    return _health_response({
         "uptime_seconds": round(uptime, 2),
-        "version": settings.VERSION,
-        "environment": settings.ENVIRONMENT,
-        "timestamp": datetime.utcnow().isoformat() + "Z"
-    }
-    
-    return metrics_data
+        "timestamp": utc_timestamp()
+    })
@@ -10,12 +10,16 @@ This module provides comprehensive REST API endpoints for the RAG system includi
 - Diversity enforcement
 """
 
+import base64
 import logging
-from typing import List, Optional, Dict, Any
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, status, File, UploadFile
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+import numpy as np
 
-from app.services.rag_service import get_rag_service, RAGService
+from app.services.rag_service import get_rag_service_async, RAGService
+from app.services.embed_batcher import embed_batcher
 from app.models.rag_models import (
     EmbeddingRequest,
     EmbeddingResponse,
@@ -37,13 +41,52 @@ from app.core.pinecone_config import get_pinecone_manager, PineconeManager
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/rag", tags=["RAG System"])
+router = APIRouter(
+    prefix="/rag",
+    tags=["RAG System"],
+    default_response_class=ORJSONResponse
+)
+
+UPLOAD_READ_SIZE = 64 * 1024  # 64KB
+INDEX_STATS_TTL_SECONDS = 5.0
+
+
+async def _read_blocks(file: UploadFile) -> AsyncIterator[bytes]:
+    """Yield an upload in fixed-size blocks"""
+    while block := await file.read(UPLOAD_READ_SIZE):
+        yield block
+
+
+def _encode_embeddings(embeddings: np.ndarray, dtype: str) -> Dict[str, Any]:
+    """
+    Pack embeddings into the requested wire format
+    
+    fp16 and int8 are sent as base64 of the little-endian array, which is a
+    fraction of the size of JSON floats. int8 is quantized per vector with
+    scale max(|v|) / 127.
+    """
+    if dtype == "fp16":
+        packed = embeddings.astype("<f2")
+        return {"embeddings_b64": base64.b64encode(packed.tobytes()).decode("ascii")}
+    
+    if dtype == "int8":
+        scales = np.abs(embeddings).max(axis=1, initial=0.0) / 127
+        # All-zero vectors quantize to zeros under any scale
+        scales[scales == 0] = 1.0
+        quantized = np.rint(embeddings / scales[:, None]).astype(np.int8)
+        return {
+            "embeddings_b64": base64.b64encode(quantized.tobytes()).decode("ascii"),
+            "scales": scales.tolist()
+        }
+    
+    return {"embeddings": embeddings.tolist()}
+
 
 # Health and Status Endpoints
-@router.get("/health", response_model=RAGHealthResponse)
+@router.get("/health", responses={200: {"model": RAGHealthResponse}})
 async def get_rag_health(
-    rag_service: RAGService = Depends(get_rag_service)
-) -> RAGHealthResponse:
+    rag_service: RAGService = Depends(get_rag_service_async)
+) -> ORJSONResponse:
     """Get comprehensive RAG system health status"""
     try:
         # Check if models and services are initialized
@@ -54,7 +97,8 @@ async def get_rag_health(
         stats = {}
         if pinecone_ready:
             try:
-                index_stats = rag_service.index.describe_index_stats()
+                # Probes poll this endpoint; only go to Pinecone when the snapshot is stale
+                index_stats = await rag_service.get_index_stats(INDEX_STATS_TTL_SECONDS)
                 stats = {
                     "total_vectors": index_stats.get("total_vector_count", 0),
                     "index_name": rag_service.index_name,
@@ -65,15 +109,18 @@ async def get_rag_health(
         
         health_status = "healthy" if (embedding_model_ready and pinecone_ready) else "unhealthy"
         
-        return RAGHealthResponse(
-            status=health_status,
-            embedding_model_ready=embedding_model_ready,
-            vector_store_ready=pinecone_ready,
-            model_name=rag_service.model_name,
-            embedding_dimension=rag_service.embedding_dimension,
-            index_name=rag_service.index_name,
-            stats=stats
-        )
+        # Polled by monitors, so skip response model validation; the fields
+        # follow RAGHealthResponse, which documents the schema
+        return ORJSONResponse(content={
+            "status": health_status,
+            "embedding_model_ready": embedding_model_ready,
+            "vector_store_ready": pinecone_ready,
+            "model_name": rag_service.model_name,
+            "embedding_dimension": rag_service.embedding_dimension,
+            "index_name": rag_service.index_name,
+            "stats": stats,
+            "timestamp": datetime.utcnow()
+        })
         
     except Exception as e:
         logger.error(f"RAG health check failed: {str(e)}")
@@ -84,11 +131,12 @@ async def get_rag_health(
 
 @router.get("/stats", response_model=Dict[str, Any])
 async def get_rag_stats(
-    rag_service: RAGService = Depends(get_rag_service)
+    refresh: bool = False,
+    rag_service: RAGService = Depends(get_rag_service_async)
 ) -> Dict[str, Any]:
-    """Get comprehensive RAG system statistics and metrics"""
+    """Get RAG system statistics; pass refresh=true to reconcile with Pinecone"""
     try:
-        stats = await rag_service.get_stats()
+        stats = await rag_service.get_stats(refresh=refresh)
         return {
             "status": "success",
             "stats": stats
@@ -105,16 +153,18 @@ async def get_rag_stats(
 @router.post("/embeddings", response_model=EmbeddingResponse)
 async def generate_embeddings(
     request: EmbeddingRequest,
-    rag_service: RAGService = Depends(get_rag_service)
+    rag_service: RAGService = Depends(get_rag_service_async)
 ) -> EmbeddingResponse:
     """Generate vector embeddings for text inputs"""
     try:
         logger.info(f"Generating embeddings for {len(request.texts)} texts")
         
-        embeddings = await rag_service.generate_embeddings(request.texts)
+        # Shares a forward pass with other requests arriving at the same time
+        embeddings = await embed_batcher.embed(request.texts)
         
         return EmbeddingResponse(
-            embeddings=embeddings,
+            **_encode_embeddings(embeddings, request.dtype),
+            dtype=request.dtype,
             model_name=rag_service.model_name,
             dimension=rag_service.embedding_dimension,
             count=len(request.texts)
@@ -132,39 +182,38 @@ async def chunk_document(
     file: UploadFile = File(...),
     chunk_size: int = 1000,
     overlap: int = 200,
-    rag_service: RAGService = Depends(get_rag_service)
-) -> JSONResponse:
+    rag_service: RAGService = Depends(get_rag_service_async)
+) -> ORJSONResponse:
     """Chunk a document into smaller pieces for embedding"""
     try:
         logger.info(f"Chunking document: {file.filename}")
         
-        # Read file content
-        content = await file.read()
-        text = content.decode('utf-8')
-        
-        # Chunk the document
-        chunks = rag_service.chunk_document(text, chunk_size, overlap)
+        # Decode and chunk the upload as it is read
+        chunks, original_length = await rag_service.chunk_stream(
+            _read_blocks(file), chunk_size, overlap
+        )
         
-        # Convert chunks to dictionary format
-        chunks_data = [
-            {
+        # Convert chunks to dictionary format, totalling lengths in the same pass
+        total_length = 0
+        chunks_data = []
+        for chunk in chunks:
+            total_length += len(chunk.text)
+            chunks_data.append({
                 "id": chunk.id,
                 "text": chunk.text,
                 "start_pos": chunk.start_pos,
                 "end_pos": chunk.end_pos,
                 "metadata": chunk.metadata
-            }
-            for chunk in chunks
-        ]
+            })
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "filename": file.filename,
             "total_chunks": len(chunks),
             "chunks": chunks_data,
             "chunk_size": chunk_size,
             "overlap": overlap,
-            "original_length": len(text),
-            "average_chunk_size": sum(len(chunk.text) for chunk in chunks) / len(chunks) if chunks else 0
+            "original_length": original_length,
+            "average_chunk_size": total_length / len(chunks) if chunks else 0
         })
         
     except Exception as e:
@@ -177,7 +226,7 @@ async def chunk_document(
 @router.post("/store", response_model=VectorStoreResponse)
 async def store_document_vectors(
     request: VectorStoreRequest,
-    rag_service: RAGService = Depends(get_rag_service)
+    rag_service: RAGService = Depends(get_rag_service_async)
 ) -> VectorStoreResponse:
     """Store document chunks as vectors in the vector database"""
     try:
@@ -215,7 +264,7 @@ async def store_document_vectors(
 @router.post("/search", response_model=SearchResponse)
 async def semantic_search(
     request: SearchRequest,
-    rag_service: RAGService = Depends(get_rag_service)
+    rag_service: RAGService = Depends(get_rag_service_async)
 ) -> SearchResponse:
     """Perform semantic search using vector similarity"""
     try:
@@ -239,7 +288,7 @@ async def semantic_search(
 @router.post("/search/hybrid", response_model=SearchResponse)
 async def hybrid_search(
     request: HybridSearchRequest,
-    rag_service: RAGService = Depends(get_rag_service)
+    rag_service: RAGService = Depends(get_rag_service_async)
 ) -> SearchResponse:
     """Perform hybrid search combining vector and keyword search"""
     try:
@@ -266,8 +315,8 @@ async def hybrid_search(
 @router.post("/context/retrieve")
 async def retrieve_context(
     request: ContextRetrievalRequest,
-    rag_service: RAGService = Depends(get_rag_service)
-) -> JSONResponse:
+    rag_service: RAGService = Depends(get_rag_service_async)
+) -> ORJSONResponse:
     """Retrieve and rank context for a given query with surrounding chunks"""
     try:
         logger.info(f"Context retrieval for: {request.query[:100]}...")
@@ -279,7 +328,7 @@ async def retrieve_context(
             file_id=request.file_id
         )
         
-        return JSONResponse(content=response)
+        return ORJSONResponse(content=response)
         
     except Exception as e:
         logger.error(f"Context retrieval failed: {str(e)}")
@@ -291,8 +340,8 @@ async def retrieve_context(
 @router.post("/query/expand")
 async def expand_query(
     request: QueryExpansionRequest,
-    rag_service: RAGService = Depends(get_rag_service)
-) -> JSONResponse:
+    rag_service: RAGService = Depends(get_rag_service_async)
+) -> ORJSONResponse:
     """Expand query for better retrieval using synonyms and related terms"""
     try:
         logger.info(f"Query expansion for: {request.query[:100]}...")
@@ -303,7 +352,7 @@ async def expand_query(
             num_expansions=request.num_expansions
         )
         
-        return JSONResponse(content=response)
+        return ORJSONResponse(content=response)
         
     except Exception as e:
         logger.error(f"Query expansion failed: {str(e)}")
@@ -315,8 +364,8 @@ async def expand_query(
 @router.post("/rerank")
 async def rerank_results(
     request: RerankingRequest,
-    rag_service: RAGService = Depends(get_rag_service)
-) -> JSONResponse:
+    rag_service: RAGService = Depends(get_rag_service_async)
+) -> ORJSONResponse:
     """Rerank search results using cross-encoder for better relevance"""
     try:
         logger.info(f"Reranking {len(request.results)} results for: {request.query[:100]}...")
@@ -327,7 +376,7 @@ async def rerank_results(
             top_k=request.top_k
         )
         
-        return JSONResponse(content=response)
+        return ORJSONResponse(content=response)
         
     except Exception as e:
         logger.error(f"Result reranking failed: {str(e)}")
@@ -341,8 +390,8 @@ async def enforce_diversity(
     results: List[Dict[str, Any]],
     diversity_threshold: float = 0.7,
     max_results: int = 10,
-    rag_service: RAGService = Depends(get_rag_service)
-) -> JSONResponse:
+    rag_service: RAGService = Depends(get_rag_service_async)
+) -> ORJSONResponse:
     """Enforce diversity in search results to avoid redundant information"""
     try:
         logger.info(f"Enforcing diversity on {len(results)} results")
@@ -353,7 +402,7 @@ async def enforce_diversity(
             max_results=max_results
         )
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "original_count": len(results),
             "diverse_count": len(diverse_results),
             "diversity_threshold": diversity_threshold,
@@ -372,15 +421,15 @@ async def enforce_diversity(
 @router.delete("/vectors/{file_id}")
 async def delete_file_vectors(
     file_id: str,
-    rag_service: RAGService = Depends(get_rag_service)
-) -> JSONResponse:
+    rag_service: RAGService = Depends(get_rag_service_async)
+) -> ORJSONResponse:
     """Delete all vectors for a specific file"""
     try:
         logger.info(f"Deleting vectors for file: {file_id}")
         
         result = await rag_service.delete_file_vectors(file_id)
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except Exception as e:
         logger.error(f"Vector deletion failed: {str(e)}")
@@ -3,30 +3,40 @@ File upload API endpoints with comprehensive validation and security.
 Implements Tasks 41-44: File upload, storage, validation, and security checks.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Form
 from fastapi.responses import JSONResponse
+import asyncio
+import mmap
 import os
+import re
 import shutil
 import hashlib
 from pathlib import Path
-import mimetypes
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 from datetime import datetime
 import uuid
-import aiofiles
 from pydantic import BaseModel
 import logging
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
+from app.services import file_meta_cache
 from app.services.data_processor import data_processor
+from app.services.file_registry import file_registry
 
 logger = get_logger(__name__)
 settings = get_settings()
 
 router = APIRouter(prefix="/api/v1/files", tags=["File Upload"])
 
+# Resolved once; settings are not reloaded at runtime
+UPLOAD_ROOT = Path(settings.UPLOAD_DIR)
+UPLOAD_ROOT.mkdir(parents=True, exist_ok=True)
+
 # Allowed file types and their magic numbers
 ALLOWED_MIME_TYPES = {
     'text/csv': ['.csv'],
@@ -37,8 +47,42 @@ ALLOWED_MIME_TYPES = {
 }
 
 ALLOWED_EXTENSIONS = {'.csv', '.xlsx', '.xls', '.json', '.txt'}
+EXT_TO_MIME = {ext: mime for mime, exts in ALLOWED_MIME_TYPES.items() for ext in exts}
+
+# Content signatures for the allowed binary formats
+MIME_SIGNATURES = (
+    (b'PK\x03\x04', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+    (b'\xd0\xcf\x11\xe0', 'application/vnd.ms-excel'),
+)
 MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB
 MAX_FILES_PER_UPLOAD = 5
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+SECURITY_SCAN_BYTES = 1024  # Leading bytes checked for signatures and suspicious content
+PREVIEW_ROWS = 1000  # Rows sampled for the metadata data preview
+# Small blocks so the preview usually needs only the first one
+PREVIEW_READ_OPTIONS = pa_csv.ReadOptions(block_size=256 * 1024)
+PREVIEW_TIMEOUT_SECONDS = 30
+# A timed-out read keeps its thread until it finishes; the bound caps how many can pile up
+_PREVIEW_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 2, thread_name_prefix="upload-preview")
+
+EXECUTABLE_SIGNATURES = (
+    b'MZ',  # Windows executable
+    b'\x7fELF',  # Linux executable
+    b'\xfe\xed\xfa',  # macOS executable
+    b'PK\x03\x04',  # ZIP file (could contain executables)
+)
+EXECUTABLE_ERROR = "File contains executable code and is not allowed"
+
+SUSPICIOUS_PATTERNS = (
+    b'<script',
+    b'javascript:',
+    b'<?php',
+    b'eval(',
+    b'exec(',
+    b'system(',
+)
+# All patterns in one alternation, so content is scanned once without a lowercased copy
+SUSPICIOUS_CONTENT_RE = re.compile(b"|".join(map(re.escape, SUSPICIOUS_PATTERNS)), re.IGNORECASE)
 
 class FileUploadResponse(BaseModel):
     file_id: str
@@ -67,24 +111,10 @@ def validate_file_type(file: UploadFile) -> FileValidationResult:
     if file_extension not in ALLOWED_EXTENSIONS:
         errors.append(f"File extension '{file_extension}' not allowed. Supported: {', '.join(ALLOWED_EXTENSIONS)}")
     
-    # Check MIME type using Python's built-in mimetypes
-    try:
-        detected_mime, _ = mimetypes.guess_type(file.filename)
-        
-        if detected_mime is None:
-            detected_mime = "application/octet-stream"
-        
-        if detected_mime not in ALLOWED_MIME_TYPES:
-            errors.append(f"File type '{detected_mime}' not supported")
-        
-        # Verify extension matches MIME type
-        expected_extensions = ALLOWED_MIME_TYPES.get(detected_mime, [])
-        if expected_extensions and file_extension not in expected_extensions:
-            warnings.append(f"File extension '{file_extension}' doesn't match detected type '{detected_mime}'")
-    
-    except Exception as e:
-        errors.append(f"Failed to detect file type: {str(e)}")
-        detected_mime = "unknown"
+    # Map the extension to its MIME type; only the allowed extensions have one
+    detected_mime = EXT_TO_MIME.get(file_extension, "application/octet-stream")
+    if detected_mime not in ALLOWED_MIME_TYPES:
+        errors.append(f"File type '{detected_mime}' not supported")
     
     file_info = {
         "filename": file.filename,
@@ -106,10 +136,12 @@ def validate_file_size(file: UploadFile) -> FileValidationResult:
     errors = []
     warnings = []
     
-    # Estimate file size
-    file.file.seek(0, 2)  # Seek to end
-    file_size = file.file.tell()
-    file.file.seek(0)  # Reset to beginning
+    # The multipart parser records the size; only measure the spooled file without it
+    file_size = getattr(file, 'size', None)
+    if file_size is None:
+        file.file.seek(0, 2)  # Seek to end
+        file_size = file.file.tell()
+        file.file.seek(0)  # Reset to beginning
     
     if file_size > MAX_FILE_SIZE:
         errors.append(f"File size ({file_size:,} bytes) exceeds maximum allowed size ({MAX_FILE_SIZE:,} bytes)")
@@ -141,43 +173,51 @@ def format_file_size(size_bytes: int) -> str:
         size_bytes /= 1024.0
     return f"{size_bytes:.1f} TB"
 
-async def scan_file_for_security(file_path: Path) -> FileValidationResult:
-    """Basic security scan for uploaded files."""
+def is_executable(head: bytes) -> bool:
+    """Check a file's leading bytes for executable or archive signatures."""
+    return head.startswith(EXECUTABLE_SIGNATURES)
+
+def sniff_mime(head: bytes, file_extension: str) -> str:
+    """Detect the MIME type from a file's leading bytes, falling back to its extension."""
+    for signature, mime in MIME_SIGNATURES:
+        if head.startswith(signature):
+            return mime
+    if head.lstrip()[:1] in (b'{', b'['):
+        return 'application/json'
+    return EXT_TO_MIME.get(file_extension, 'application/octet-stream')
+
+def analyze_file(file_path: Path) -> FileValidationResult:
+    """
+    Security-scan and hash a saved file in one pass over a memory map.
+    Blocking - call through asyncio.to_thread.
+    
+    The SHA-256 is returned in file_info["file_hash_sha256"].
+    """
     errors = []
     warnings = []
+    file_hash = None
     
     try:
-        # Check for suspicious file patterns
         with open(file_path, 'rb') as f:
-            content = f.read(1024)  # Read first 1KB
-            
-            # Check for executable signatures
-            executable_signatures = [
-                b'MZ',  # Windows executable
-                b'\x7fELF',  # Linux executable
-                b'\xfe\xed\xfa',  # macOS executable
-                b'PK\x03\x04',  # ZIP file (could contain executables)
-            ]
-            
-            for sig in executable_signatures:
-                if content.startswith(sig):
-                    errors.append("File contains executable code and is not allowed")
-                    break
-            
-            # Check for suspicious strings
-            suspicious_patterns = [
-                b'<script',
-                b'javascript:',
-                b'<?php',
-                b'eval(',
-                b'exec(',
-                b'system(',
-            ]
-            
-            content_lower = content.lower()
-            for pattern in suspicious_patterns:
-                if pattern in content_lower:
-                    warnings.append(f"File contains potentially suspicious content: {pattern.decode('utf-8', errors='ignore')}")
+            if os.fstat(f.fileno()).st_size == 0:
+                # Empty files cannot be mapped
+                content = b""
+                file_hash = hashlib.sha256().hexdigest()
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    content = mm[:SECURITY_SCAN_BYTES]
+                    # hashlib reads the mapping directly and releases the GIL while hashing
+                    file_hash = hashlib.sha256(mm).hexdigest()
+        
+        # Check for executable signatures
+        if is_executable(content):
+            errors.append(EXECUTABLE_ERROR)
+        
+        # Check for suspicious strings in one case-insensitive sweep
+        found = {match.group().lower() for match in SUSPICIOUS_CONTENT_RE.finditer(content)}
+        for pattern in SUSPICIOUS_PATTERNS:
+            if pattern in found:
+                warnings.append(f"File contains potentially suspicious content: {pattern.decode('utf-8', errors='ignore')}")
     
     except Exception as e:
         warnings.append(f"Security scan failed: {str(e)}")
@@ -186,36 +226,101 @@ async def scan_file_for_security(file_path: Path) -> FileValidationResult:
         is_valid=len(errors) == 0,
         errors=errors,
         warnings=warnings,
-        file_info={"security_scan_completed": True}
+        file_info={"security_scan_completed": True, "file_hash_sha256": file_hash}
     )
 
-async def generate_file_metadata(file_path: Path, original_filename: str) -> dict:
+def save_upload(source, file_path: Path) -> None:
+    """
+    Copy an upload's spooled file to file_path. Blocking - call through asyncio.to_thread.
+    
+    Uploads already spooled to disk are copied in the kernel with sendfile;
+    small ones still held in memory are written out directly.
+    """
+    source.seek(0)
+    with open(file_path, 'wb') as dest:
+        # Same check Starlette uses; fileno() on an in-memory spool would force a rollover
+        if getattr(source, "_rolled", True) and hasattr(os, "sendfile"):
+            source_fd = source.fileno()
+            size = os.fstat(source_fd).st_size
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(dest.fileno(), source_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        else:
+            shutil.copyfileobj(source, dest, UPLOAD_CHUNK_SIZE)
+
+def read_csv_preview(file_path: Path, nrows: int) -> pd.DataFrame:
+    """
+    Read the first nrows of a CSV with Arrow's streaming reader, stopping after the
+    record batch that covers them.
+    
+    Arrow infers column types from the first block; if a later block contradicts
+    them, fall back to pandas, which infers over all rows read.
+    """
+    try:
+        with pa.memory_map(str(file_path)) as source:
+            # Date and time columns stay text, as pd.read_csv leaves them
+            reader = file_meta_cache.open_csv(source, read_options=PREVIEW_READ_OPTIONS)
+            batches = []
+            rows = 0
+            for batch in reader:
+                batches.append(batch)
+                rows += batch.num_rows
+                if rows >= nrows:
+                    break
+            table = pa.Table.from_batches(batches, schema=reader.schema)
+        return table.slice(0, nrows).to_pandas()
+    except pa.ArrowInvalid:
+        return pd.read_csv(file_path, nrows=nrows)
+
+def read_preview(file_path: Path) -> pd.DataFrame:
+    """Read the first PREVIEW_ROWS of a CSV or Excel file. Blocking - run in _PREVIEW_POOL."""
+    if file_path.suffix.lower() == '.csv':
+        return read_csv_preview(file_path, PREVIEW_ROWS)
+    return pd.read_excel(file_path, nrows=PREVIEW_ROWS)
+
+async def generate_file_metadata(
+    file_path: Path,
+    original_filename: str,
+    file_hash: Optional[str] = None,
+    mime_type: Optional[str] = None
+) -> dict:
     """Generate comprehensive metadata for uploaded file."""
     try:
         file_stats = file_path.stat()
-        file_hash = hashlib.sha256()
         
-        # Calculate file hash
-        with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                file_hash.update(chunk)
+        # Calculate file hash unless the security scan already did
+        if file_hash is None:
+            # file_digest hashes in a single C loop rather than a Python read loop
+            with open(file_path, 'rb') as f:
+                file_hash = hashlib.file_digest(f, "sha256").hexdigest()
+        
+        # Sniff the type unless the caller already did from the upload's first bytes
+        if mime_type is None:
+            with open(file_path, 'rb') as f:
+                mime_type = sniff_mime(f.read(16), file_path.suffix.lower())
         
         metadata = {
             "original_filename": original_filename,
             "file_size": file_stats.st_size,
             "upload_timestamp": datetime.now().isoformat(),
-            "file_hash_sha256": file_hash.hexdigest(),
+            "file_hash_sha256": file_hash,
             "file_extension": file_path.suffix.lower(),
-            "mime_type": magic.from_file(str(file_path), mime=True),
+            "mime_type": mime_type,
         }
         
         # Try to extract data-specific metadata
         if file_path.suffix.lower() in ['.csv', '.xlsx', '.xls']:
             try:
-                if file_path.suffix.lower() == '.csv':
-                    df = pd.read_csv(file_path, nrows=1000)  # Sample first 1000 rows
-                else:
-                    df = pd.read_excel(file_path, nrows=1000)
+                # Own bounded pool and a timeout, so crafted files cannot tie up the
+                # shared threadpool or hold the upload indefinitely
+                loop = asyncio.get_running_loop()
+                df = await asyncio.wait_for(
+                    loop.run_in_executor(_PREVIEW_POOL, read_preview, file_path),
+                    timeout=PREVIEW_TIMEOUT_SECONDS
+                )
                 
                 metadata.update({
                     "data_preview": {
@@ -226,6 +331,8 @@ async def generate_file_metadata(file_path: Path, original_filename: str) -> dic
                         "sample_data": df.head(3).to_dict('records')
                     }
                 })
+            except asyncio.TimeoutError:
+                metadata["data_preview_error"] = f"Preview timed out after {PREVIEW_TIMEOUT_SECONDS} seconds"
             except Exception as e:
                 metadata["data_preview_error"] = str(e)
         
@@ -235,6 +342,177 @@ async def generate_file_metadata(file_path: Path, original_filename: str) -> dic
         logger.error(f"Failed to generate metadata for {file_path}: {str(e)}")
         return {"error": f"Metadata generation failed: {str(e)}"}
 
+async def _process_upload(file: UploadFile, file_id: str, upload_dir: Path) -> FileUploadResponse:
+    """
+    Validate, save, scan and profile one uploaded file.
+    
+    Responses are built from values this function produces, so they skip
+    validation with model_construct.
+    """
+    try:
+        # Step 1: File type validation
+        type_validation = validate_file_type(file)
+        
+        # Step 2: File size validation
+        size_validation = validate_file_size(file)
+        
+        # Combine validation results
+        all_errors = type_validation.errors + size_validation.errors
+        all_warnings = type_validation.warnings + size_validation.warnings
+        
+        if all_errors:
+            return FileUploadResponse.model_construct(
+                file_id=file_id,
+                filename=file.filename,
+                size=size_validation.file_info.get("size_bytes", 0),
+                mime_type=type_validation.file_info.get("detected_mime_type", "unknown"),
+                status="validation_failed",
+                upload_timestamp=datetime.now(),
+                validation_results={
+                    "errors": all_errors,
+                    "warnings": all_warnings
+                },
+                preview_available=False,
+                metadata={}
+            )
+        
+        # Reject executables from their first bytes, before anything is written to disk;
+        # the same bytes give the sniffed MIME type for the metadata
+        head = await file.read(SECURITY_SCAN_BYTES)
+        await file.seek(0)
+        mime_type = sniff_mime(head, type_validation.file_info["file_extension"])
+        if is_executable(head):
+            all_errors.append(EXECUTABLE_ERROR)
+            return FileUploadResponse.model_construct(
+                file_id=file_id,
+                filename=file.filename,
+                size=size_validation.file_info.get("size_bytes", 0),
+                mime_type=type_validation.file_info.get("detected_mime_type", "unknown"),
+                status="security_failed",
+                upload_timestamp=datetime.now(),
+                validation_results={
+                    "errors": all_errors,
+                    "warnings": all_warnings
+                },
+                preview_available=False,
+                metadata={}
+            )
+        
+        # Step 3: Save file to secure location
+        upload_dir.mkdir(exist_ok=True)
+        
+        # Generate secure filename
+        secure_filename = f"{file_id}_{file.filename}"
+        file_path = upload_dir / secure_filename
+        
+        await asyncio.to_thread(save_upload, file.file, file_path)
+        
+        file_registry.register(file_id, file_path, file.filename)
+        
+        # Step 4: Security scan and hash in one pass over the saved file, in a
+        # worker thread so concurrent uploads hash in parallel
+        security_validation = await asyncio.to_thread(analyze_file, file_path)
+        file_hash = security_validation.file_info["file_hash_sha256"]
+        all_errors.extend(security_validation.errors)
+        all_warnings.extend(security_validation.warnings)
+        
+        if security_validation.errors:
+            # Delete file if security issues found
+            file_path.unlink(missing_ok=True)
+            file_registry.remove(file_id)
+            
+            return FileUploadResponse.model_construct(
+                file_id=file_id,
+                filename=file.filename,
+                size=size_validation.file_info.get("size_bytes", 0),
+                mime_type=type_validation.file_info.get("detected_mime_type", "unknown"),
+                status="security_failed",
+                upload_timestamp=datetime.now(),
+                validation_results={
+                    "errors": all_errors,
+                    "warnings": all_warnings
+                },
+                preview_available=False,
+                metadata={}
+            )
+        
+        # Step 5: Generate metadata and process data
+        metadata = await generate_file_metadata(
+            file_path,
+            file.filename,
+            file_hash,
+            mime_type
+        )
+        
+        # Step 6: Process data for preview and profiling
+        file_registry.set_status(file_id, "processing")
+        try:
+            data_profile = await data_processor.process_file_isolated(file_path, file_id)
+            metadata["data_profile"] = {
+                "row_count": data_profile.row_count,
+                "column_count": data_profile.column_count,
+                "quality_score": data_profile.quality_score,
+                "overall_quality": data_profile.overall_quality,
+                "processing_time": data_profile.processing_time,
+                "recommendations": data_profile.recommendations[:3],  # Top 3 recommendations
+                "column_types": {
+                    "numeric": data_profile.numeric_columns,
+                    "categorical": data_profile.categorical_columns,
+                    "datetime": data_profile.datetime_columns,
+                    "text": data_profile.text_columns
+                }
+            }
+            preview_available = True
+            file_registry.set_status(
+                file_id,
+                "ready",
+                row_count=data_profile.row_count,
+                column_count=data_profile.column_count,
+                overall_quality=data_profile.overall_quality
+            )
+            logger.info(f"Data processing completed for {file.filename}. Quality: {data_profile.overall_quality}")
+        except Exception as processing_error:
+            logger.error(f"Data processing failed for {file.filename}: {str(processing_error)}")
+            metadata["data_processing_error"] = str(processing_error)
+            file_registry.set_status(file_id, "processing_failed", error=str(processing_error))
+            preview_available = "data_preview" in metadata
+        
+        logger.info(f"File uploaded successfully: {file.filename} -> {file_id}")
+        
+        # Success response
+        return FileUploadResponse.model_construct(
+            file_id=file_id,
+            filename=file.filename,
+            size=size_validation.file_info.get("size_bytes", 0),
+            mime_type=type_validation.file_info.get("detected_mime_type", "unknown"),
+            status="success",
+            upload_timestamp=datetime.now(),
+            validation_results={
+                "errors": [],
+                "warnings": all_warnings
+            },
+            preview_available="data_profile" in metadata or "data_preview" in metadata,
+            metadata=metadata
+        )
+    
+    except Exception as e:
+        logger.error(f"Upload failed for {file.filename}: {str(e)}")
+        
+        return FileUploadResponse.model_construct(
+            file_id=file_id,
+            filename=file.filename,
+            size=0,
+            mime_type="unknown",
+            status="upload_failed",
+            upload_timestamp=datetime.now(),
+            validation_results={
+                "errors": [f"Upload failed: {str(e)}"],
+                "warnings": []
+            },
+            preview_available=False,
+            metadata={}
+        )
+
 @router.post("/upload", response_model=List[FileUploadResponse])
 async def upload_files(
     files: List[UploadFile] = File(...),
@@ -261,150 +539,34 @@ async def upload_files(
             detail=f"Too many files. Maximum {MAX_FILES_PER_UPLOAD} files allowed per upload."
         )
     
-    responses = []
     upload_session_id = str(uuid.uuid4())
+    upload_dir = UPLOAD_ROOT / upload_session_id
     
-    for file in files:
-        file_id = str(uuid.uuid4())
-        
-        try:
-            # Step 1: File type validation
-            type_validation = validate_file_type(file)
-            
-            # Step 2: File size validation
-            size_validation = validate_file_size(file)
-            
-            # Combine validation results
-            all_errors = type_validation.errors + size_validation.errors
-            all_warnings = type_validation.warnings + size_validation.warnings
-            
-            if all_errors:
-                responses.append(FileUploadResponse(
-                    file_id=file_id,
-                    filename=file.filename,
-                    size=size_validation.file_info.get("size_bytes", 0),
-                    mime_type=type_validation.file_info.get("detected_mime_type", "unknown"),
-                    status="validation_failed",
-                    upload_timestamp=datetime.now(),
-                    validation_results={
-                        "errors": all_errors,
-                        "warnings": all_warnings
-                    },
-                    preview_available=False,
-                    metadata={}
-                ))
-                continue
-            
-            # Step 3: Save file to secure location
-            upload_dir = Path(settings.UPLOAD_DIR) / upload_session_id
-            upload_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Generate secure filename
-            secure_filename = f"{file_id}_{file.filename}"
-            file_path = upload_dir / secure_filename
-            
-            # Save file
-            async with aiofiles.open(file_path, 'wb') as f:
-                content = await file.read()
-                await f.write(content)
-            
-            # Step 4: Security scan
-            security_validation = await scan_file_for_security(file_path)
-            all_errors.extend(security_validation.errors)
-            all_warnings.extend(security_validation.warnings)
-            
-            if security_validation.errors:
-                # Delete file if security issues found
-                file_path.unlink(missing_ok=True)
-                
-                responses.append(FileUploadResponse(
-                    file_id=file_id,
-                    filename=file.filename,
-                    size=size_validation.file_info.get("size_bytes", 0),
-                    mime_type=type_validation.file_info.get("detected_mime_type", "unknown"),
-                    status="security_failed",
-                    upload_timestamp=datetime.now(),
-                    validation_results={
-                        "errors": all_errors,
-                        "warnings": all_warnings
-                    },
-                    preview_available=False,
-                    metadata={}
-                ))
-                continue
-            
-            # Step 5: Generate metadata and process data
-            metadata = await generate_file_metadata(file_path, file.filename)
-            
-            # Step 6: Process data for preview and profiling
-            try:
-                data_profile = await data_processor.process_file(file_path, file_id)
-                metadata["data_profile"] = {
-                    "row_count": data_profile.row_count,
-                    "column_count": data_profile.column_count,
-                    "quality_score": data_profile.quality_score,
-                    "overall_quality": data_profile.overall_quality,
-                    "processing_time": data_profile.processing_time,
-                    "recommendations": data_profile.recommendations[:3],  # Top 3 recommendations
-                    "column_types": {
-                        "numeric": data_profile.numeric_columns,
-                        "categorical": data_profile.categorical_columns,
-                        "datetime": data_profile.datetime_columns,
-                        "text": data_profile.text_columns
-                    }
-                }
-                preview_available = True
-                logger.info(f"Data processing completed for {file.filename}. Quality: {data_profile.overall_quality}")
-            except Exception as processing_error:
-                logger.error(f"Data processing failed for {file.filename}: {str(processing_error)}")
-                metadata["data_processing_error"] = str(processing_error)
-                preview_available = "data_preview" in metadata
-            
-            # Success response
-            responses.append(FileUploadResponse(
-                file_id=file_id,
-                filename=file.filename,
-                size=size_validation.file_info.get("size_bytes", 0),
-                mime_type=type_validation.file_info.get("detected_mime_type", "unknown"),
-                status="success",
-                upload_timestamp=datetime.now(),
-                validation_results={
-                    "errors": [],
-                    "warnings": all_warnings
-                },
-                preview_available="data_profile" in metadata or "data_preview" in metadata,
-                metadata=metadata
-            ))
-            
-            logger.info(f"File uploaded successfully: {file.filename} -> {file_id}")
-            
-        except Exception as e:
-            logger.error(f"Upload failed for {file.filename}: {str(e)}")
-            
-            responses.append(FileUploadResponse(
-                file_id=file_id,
-                filename=file.filename,
-                size=0,
-                mime_type="unknown",
-                status="upload_failed",
-                upload_timestamp=datetime.now(),
-                validation_results={
-                    "errors": [f"Upload failed: {str(e)}"],
-                    "warnings": []
-                },
-                preview_available=False,
-                metadata={}
-            ))
+    # Files are independent, so they are processed concurrently; blocking work
+    # inside runs in worker threads or the data processor's process pool
+    responses = await asyncio.gather(*(
+        _process_upload(file, str(uuid.uuid4()), upload_dir) for file in files
+    ))
     
-    logger.info(f"Upload session completed: {upload_session_id}. Results: {len([r for r in responses if r.status == 'success'])} successful, {len([r for r in responses if r.status != 'success'])} failed")
+    success_count = sum(1 for r in responses if r.status == 'success')
+    logger.info(f"Upload session completed: {upload_session_id}. Results: {success_count} successful, {len(responses) - success_count} failed")
     
     return responses
 
 @router.get("/upload-status/{file_id}")
 async def get_upload_status(file_id: str):
     """Get the status of a file upload."""
-    # TODO: Implement file status tracking
-    return {"file_id": file_id, "status": "not_implemented"}
+    record = file_registry.get(file_id)
+    if not record:
+        raise HTTPException(status_code=404, detail="File not found")
+    
+    return {
+        "file_id": file_id,
+        "filename": record.original_filename,
+        "status": record.status,
+        "updated_at": record.updated_at.isoformat(),
+        **record.details
+    }
 
 @router.delete("/files/{file_id}")
 async def delete_file(file_id: str):
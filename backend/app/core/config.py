@@ -160,6 +160,8 @@ class Settings(BaseSettings):
     ENABLE_CACHING: bool = True
     CACHE_TTL: int = 3600  # 1 hour
     REQUEST_TIMEOUT: int = 30
+    THREADPOOL_SIZE: int = 100  # Threads for sync endpoints, file I/O and asyncio.to_thread
+    PROFILE_WORKERS: int = 2  # Worker processes for CPU-bound data profiling
     
     # Feature Flags
     ENABLE_FILE_UPLOAD: bool = True
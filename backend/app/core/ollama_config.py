@@ -9,6 +9,7 @@ from typing import Optional, Dict, Any, List
 from pydantic import BaseSettings, Field
 import httpx
 import asyncio
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +36,7 @@ class OllamaConfig(BaseSettings):
     # Health check settings
     health_check_interval: int = Field(default=30, env="OLLAMA_HEALTH_CHECK_INTERVAL")
     max_retries: int = Field(default=3, env="OLLAMA_MAX_RETRIES")
+    health_check_timeout: float = Field(default=5.0, env="OLLAMA_HEALTH_CHECK_TIMEOUT")
     
     class Config:
         env_prefix = "OLLAMA_"
@@ -52,6 +54,7 @@ class OllamaManager:
         )
         self._is_initialized = False
         self._model_loaded = False
+        self._last_health_failure: Optional[float] = None
     
     async def initialize(self) -> bool:
         """Initialize Ollama connection and load model"""
@@ -77,12 +80,25 @@ class OllamaManager:
     
     async def health_check(self) -> bool:
         """Check if Ollama server is healthy"""
+        # Circuit breaker: skip the network probe for a while after a failure
+        if (
+            self._last_health_failure is not None
+            and time.monotonic() - self._last_health_failure < self.config.health_check_interval
+        ):
+            return False
+        
         try:
-            response = await self.client.get("/api/tags")
-            return response.status_code == 200
+            response = await self.client.get(
+                "/api/tags",
+                timeout=self.config.health_check_timeout
+            )
+            healthy = response.status_code == 200
         except Exception as e:
             logger.error(f"Ollama health check failed: {e}")
-            return False
+            healthy = False
+        
+        self._last_health_failure = None if healthy else time.monotonic()
+        return healthy
     
     async def is_model_available(self) -> bool:
         """Check if the specified model is available"""
@@ -3,6 +3,7 @@ Pinecone Vector Database Configuration
 Enterprise Insights Copilot - RAG System
 """
 
+import asyncio
 import os
 from typing import Optional, Dict, Any, List
 from pydantic import Field, validator
@@ -265,6 +266,7 @@ class PineconeManager:
 
 # Global instance - will be initialized lazily
 pinecone_manager = None
+_pinecone_manager_lock = asyncio.Lock()
 
 
 async def get_pinecone_manager() -> PineconeManager:
@@ -272,8 +274,12 @@ async def get_pinecone_manager() -> PineconeManager:
     global pinecone_manager
     
     if pinecone_manager is None:
-        pinecone_manager = PineconeManager()
-        # Try to initialize, but don't fail if API key is missing
-        await pinecone_manager.initialize()
+        # Concurrent first requests share one construction and initialization
+        async with _pinecone_manager_lock:
+            if pinecone_manager is None:
+                manager = PineconeManager()
+                # Try to initialize, but don't fail if API key is missing
+                await manager.initialize()
+                pinecone_manager = manager
     
     return pinecone_manager
@@ -0,0 +1,87 @@
+"""
+Enterprise Insights Copilot - Readiness State
+Background-refreshed dependency readiness for Kubernetes probes
+"""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+REFRESH_INTERVAL_SECONDS = 2.0
+REFRESH_JITTER_SECONDS = 0.5
+# A hanging dependency check counts as a failure rather than stalling the refresher
+CHECK_TIMEOUT_SECONDS = 5.0
+# A state older than a few refresh cycles means the refresher died or is stuck
+STALE_AFTER_SECONDS = CHECK_TIMEOUT_SECONDS + 3 * (REFRESH_INTERVAL_SECONDS + REFRESH_JITTER_SECONDS)
+
+ReadinessCheck = Callable[[], Awaitable[Tuple[bool, Dict[str, Any]]]]
+
+
+@dataclass(frozen=True)
+class ReadinessState:
+    """Outcome of the latest dependency checks"""
+    ready: bool
+    checks: Dict[str, Any]
+    timestamp: float  # time.monotonic() when the checks finished
+
+
+_state: Optional[ReadinessState] = None
+_refresher: Optional[asyncio.Task] = None
+
+
+def get_state() -> Optional[ReadinessState]:
+    """Latest readiness state, or None if the refresher has not completed a run recently"""
+    state = _state
+    if state is None or time.monotonic() - state.timestamp > STALE_AFTER_SECONDS:
+        return None
+    return state
+
+
+async def _refresh_loop(check: ReadinessCheck) -> None:
+    """Run the checks on a jittered schedule so only one probe is ever in flight"""
+    global _state
+    while True:
+        try:
+            ready, checks = await asyncio.wait_for(check(), CHECK_TIMEOUT_SECONDS)
+            _state = ReadinessState(ready=ready, checks=checks, timestamp=time.monotonic())
+        except asyncio.TimeoutError:
+            logger.error("Readiness refresh timed out", timeout=CHECK_TIMEOUT_SECONDS)
+            _state = ReadinessState(
+                ready=False,
+                checks={"message": "Readiness check timed out"},
+                timestamp=time.monotonic(),
+            )
+        except Exception as e:
+            logger.error("Readiness refresh failed", error=str(e))
+            _state = ReadinessState(
+                ready=False,
+                checks={"error": str(e), "message": "Readiness check failed"},
+                timestamp=time.monotonic(),
+            )
+        await asyncio.sleep(REFRESH_INTERVAL_SECONDS + random.uniform(0, REFRESH_JITTER_SECONDS))
+
+
+def start(check: ReadinessCheck) -> None:
+    """Start the background refresher on the running loop"""
+    global _refresher
+    if _refresher is None or _refresher.done():
+        _refresher = asyncio.create_task(_refresh_loop(check))
+
+
+async def stop() -> None:
+    """Stop the background refresher and forget the last state"""
+    global _refresher, _state
+    if _refresher is not None:
+        _refresher.cancel()
+        try:
+            await _refresher
+        except asyncio.CancelledError:
+            pass
+        _refresher = None
+    _state = None
@@ -0,0 +1,152 @@
+"""
+Enterprise Insights Copilot - System Resource Cache
+Background-sampled CPU, memory and disk usage for health checks
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import psutil
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+REFRESH_INTERVAL_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class SystemSnapshot:
+    """Point-in-time system resource usage"""
+    cpu_percent: float
+    memory_percent: float
+    disk_percent: float
+    timestamp: float
+
+
+_snapshot: Optional[SystemSnapshot] = None
+_refresher: Optional[asyncio.Task] = None
+
+# On Linux the few fields needed are read straight from /proc instead of
+# through psutil's full parsers
+_USE_PROC = os.path.exists("/proc/meminfo") and os.path.exists("/proc/stat")
+# (busy, total) jiffies at the previous CPU reading
+_cpu_times: Optional[Tuple[int, int]] = None
+
+
+def _read_proc(path: str) -> bytes:
+    """Read the head of a /proc file in one syscall"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, 4096)
+    finally:
+        os.close(fd)
+
+
+def _meminfo_kb(buf: bytes, field: bytes) -> int:
+    """Extract a kB value such as b"MemTotal:" from /proc/meminfo contents"""
+    start = buf.index(field) + len(field)
+    return int(buf[start:buf.index(b"\n", start)].split()[0])
+
+
+def _proc_cpu_percent() -> float:
+    """CPU usage since the previous call, matching psutil.cpu_percent(interval=None)"""
+    global _cpu_times
+    buf = _read_proc("/proc/stat")
+    # First line: cpu user nice system idle iowait irq softirq steal guest guest_nice
+    fields = [int(value) for value in buf[:buf.index(b"\n")].split()[1:]]
+    # guest time is already counted in user/nice
+    total = sum(fields[:8])
+    busy = total - fields[3] - fields[4]
+
+    previous, _cpu_times = _cpu_times, (busy, total)
+    if previous is None or total <= previous[1]:
+        return 0.0
+    return min(max((busy - previous[0]) / (total - previous[1]) * 100, 0.0), 100.0)
+
+
+def _sample_proc() -> SystemSnapshot:
+    """Read resource usage from /proc and statvfs"""
+    meminfo = _read_proc("/proc/meminfo")
+    mem_total = _meminfo_kb(meminfo, b"MemTotal:")
+    mem_available = _meminfo_kb(meminfo, b"MemAvailable:")
+    disk = os.statvfs('/')
+    return SystemSnapshot(
+        cpu_percent=_proc_cpu_percent(),
+        memory_percent=(mem_total - mem_available) / mem_total * 100,
+        disk_percent=(disk.f_blocks - disk.f_bfree) / disk.f_blocks * 100,
+        timestamp=time.time(),
+    )
+
+
+def sample() -> SystemSnapshot:
+    """Read current resource usage without blocking on a CPU sampling interval"""
+    if _USE_PROC:
+        try:
+            return _sample_proc()
+        except (OSError, ValueError, IndexError, ZeroDivisionError) as e:
+            # /proc files can be transiently truncated; serve the last good value
+            logger.warning("Reading /proc failed", error=str(e))
+            if _snapshot is not None:
+                return _snapshot
+
+    # interval=None reports usage since the previous call instead of sleeping
+    cpu_percent = psutil.cpu_percent(interval=None)
+    memory = psutil.virtual_memory()
+    disk = psutil.disk_usage('/')
+    return SystemSnapshot(
+        cpu_percent=cpu_percent,
+        memory_percent=memory.percent,
+        disk_percent=(disk.used / disk.total) * 100,
+        timestamp=time.time(),
+    )
+
+
+def get_snapshot() -> SystemSnapshot:
+    """Get the latest snapshot, sampling directly if the refresher has not run yet"""
+    global _snapshot
+    if _snapshot is None:
+        _snapshot = sample()
+    return _snapshot
+
+
+async def _refresh_loop() -> None:
+    """Refresh the snapshot every REFRESH_INTERVAL_SECONDS"""
+    global _snapshot
+    while True:
+        try:
+            _snapshot = await asyncio.to_thread(sample)
+        except (psutil.Error, OSError, TypeError, KeyError) as e:
+            # psutil can raise transiently while /proc is being rewritten;
+            # keep serving the previous snapshot
+            logger.warning("System resource sampling failed", error=str(e))
+        await asyncio.sleep(REFRESH_INTERVAL_SECONDS)
+
+
+def start() -> None:
+    """Start the background refresher on the running loop"""
+    global _refresher
+    if _refresher is None or _refresher.done():
+        # Prime the CPU counters so the first interval=None reading is meaningful
+        if _USE_PROC:
+            try:
+                _proc_cpu_percent()
+            except (OSError, ValueError, IndexError):
+                pass
+        psutil.cpu_percent(interval=None)
+        _refresher = asyncio.create_task(_refresh_loop())
+
+
+async def stop() -> None:
+    """Stop the background refresher"""
+    global _refresher
+    if _refresher is not None:
+        _refresher.cancel()
+        try:
+            await _refresher
+        except asyncio.CancelledError:
+            pass
+        _refresher = None
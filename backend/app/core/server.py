@@ -3,6 +3,8 @@ Enterprise Insights Copilot - Uvicorn Server Configuration
 MAANG-level production-ready server setup
 """
 
+import sys
+
 import uvicorn
 from app.core.config import settings
 from app.core.logging import get_logger
@@ -23,7 +25,7 @@ def create_uvicorn_config():
         "log_level": env_config.get('log_level', 'info').lower(),
         "access_log": True,
         "use_colors": env_config.get('debug', False),
-        "loop": "auto",  # Use best available event loop
+        "loop": "auto" if sys.platform == "win32" else "uvloop",  # uvloop is not available on Windows
         "http": "auto",  # Use best available HTTP implementation
     }
     
@@ -0,0 +1,60 @@
+"""
+Enterprise Insights Copilot - Response Compression
+GZip for buffered responses that leaves event streams uncompressed
+"""
+
+from fastapi import FastAPI
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder
+from starlette.types import Message, Receive, Scope, Send
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+GZIP_MINIMUM_SIZE = 1000
+
+# The gzip stream is only flushed when it closes, so compressing these would
+# hold every event back until the connection ends
+UNCOMPRESSED_MEDIA_TYPES = ("text/event-stream",)
+
+
+class StreamingAwareGZipResponder(GZipResponder):
+    """GZipResponder that passes responses with an uncompressed media type through as sent"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.passthrough = False
+
+    async def send_with_gzip(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            content_type = Headers(raw=message["headers"]).get("content-type", "")
+            self.passthrough = content_type.startswith(UNCOMPRESSED_MEDIA_TYPES)
+
+        if self.passthrough:
+            await self.send(message)
+            return
+        await super().send_with_gzip(message)
+
+
+class StreamingAwareGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that skips compression for event streams"""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and "gzip" in Headers(scope=scope).get("Accept-Encoding", ""):
+            responder = StreamingAwareGZipResponder(
+                self.app, self.minimum_size, compresslevel=self.compresslevel
+            )
+            await responder(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+def setup_compression(app: FastAPI) -> None:
+    """Set up gzip compression for large buffered responses"""
+    app.add_middleware(StreamingAwareGZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE)
+    logger.info(
+        "Compression middleware configured",
+        minimum_size=GZIP_MINIMUM_SIZE,
+        uncompressed=list(UNCOMPRESSED_MEDIA_TYPES),
+    )
@@ -12,6 +12,7 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from pydantic import ValidationError
 import asyncio
+from datetime import datetime
 
 from app.core.config import settings
 from app.core.logging import get_logger, log_security_event, get_request_id
@@ -391,7 +392,6 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
     
     def _get_timestamp(self) -> str:
         """Get current timestamp in ISO format"""
-        from datetime import datetime
         return datetime.utcnow().isoformat() + "Z"
 
 
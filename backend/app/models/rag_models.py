@@ -8,7 +8,7 @@ These models define the data structures for:
 - Vector storage operations
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Literal, Optional
 from datetime import datetime
 from pydantic import BaseModel, Field
 
@@ -21,10 +21,23 @@ class EmbeddingRequest(BaseModel):
     """Request model for generating embeddings"""
     texts: List[str] = Field(..., description="List of texts to generate embeddings for")
     model_name: Optional[str] = Field(default="all-MiniLM-L6-v2", description="Embedding model to use")
+    dtype: Literal["fp32", "fp16", "int8"] = Field(
+        default="fp32",
+        description="Wire format: fp32 float lists, or fp16/int8 packed as base64"
+    )
 
 class EmbeddingResponse(BaseModel):
     """Response model for generated embeddings"""
-    embeddings: List[List[float]] = Field(..., description="Generated embedding vectors")
+    embeddings: Optional[List[List[float]]] = Field(default=None, description="Generated embedding vectors (fp32 only)")
+    embeddings_b64: Optional[str] = Field(
+        default=None,
+        description="Base64 of the row-major little-endian count x dimension array (fp16 and int8 only)"
+    )
+    scales: Optional[List[float]] = Field(
+        default=None,
+        description="Per-vector dequantization scales; vector i is int8 row i times scales[i] (int8 only)"
+    )
+    dtype: Literal["fp32", "fp16", "int8"] = Field(default="fp32", description="Wire format of the embeddings")
     model_name: str = Field(..., description="Model used for embeddings")
     dimension: int = Field(..., description="Dimension of embedding vectors")
     count: int = Field(..., description="Number of embeddings generated")
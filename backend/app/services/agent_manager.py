@@ -10,6 +10,8 @@ from typing import Dict, Any, List, Optional, AsyncGenerator
 from dataclasses import dataclass, asdict
 import logging
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -304,6 +306,9 @@ class AgentManager:
                 timestamp=datetime.now()
             ))
     
+    # The sync accessors below are called directly from async handlers; keep them
+    # free of blocking I/O or make them async.
+    
     def get_execution_status(self, execution_id: str) -> Optional[Dict[str, Any]]:
         """Get status of an agent execution."""
         if execution_id in self.executions:
@@ -346,8 +351,8 @@ class AgentManager:
         
         return None
     
-    async def subscribe_to_updates(self, session_id: str) -> AsyncGenerator[StatusUpdate, None]:
-        """Subscribe to real-time status updates for a session."""
+    async def subscribe_to_updates(self, session_id: str) -> AsyncGenerator[bytes, None]:
+        """Subscribe to real-time status updates for a session, as JSON-encoded StatusUpdate bytes."""
         queue = asyncio.Queue()
         
         if session_id not in self.status_subscribers:
@@ -368,12 +373,18 @@ class AgentManager:
     
     async def _broadcast_status_update(self, update: StatusUpdate):
         """Broadcast status update to all subscribers."""
+        if not self.status_subscribers:
+            return
+        
+        # Serialize once and share the bytes with every subscriber
+        payload = orjson.dumps(update)
+        
         # For now, broadcast to all sessions
         # In production, you'd filter by session_id
         for session_id, queues in self.status_subscribers.items():
             for queue in queues:
                 try:
-                    await queue.put(update)
+                    await queue.put(payload)
                 except Exception as e:
                     logger.error(f"Failed to broadcast update: {e}")
     
@@ -9,6 +9,8 @@ from typing import Dict, Any, List, Optional
 from dataclasses import dataclass, asdict
 import logging
 
+from app.services.session_manager import session_manager
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -39,8 +41,6 @@ class ConversationManager:
         context: Optional[Dict[str, Any]] = None
     ) -> Conversation:
         """Add a message to a conversation and get agent response."""
-        from app.services.session_manager import session_manager
-        
         conversation_id = str(uuid.uuid4())
         
         # Initialize session messages if not exists
@@ -4,10 +4,14 @@ Implements Tasks 51-60: Data parsing, validation, profiling, and quality assessm
 """
 
 from typing import Dict, List, Optional, Any, Union, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import asyncio
+import multiprocessing
 import pandas as pd
-import numpy as np
 from pathlib import Path
 import json
+import numbers
 from datetime import datetime
 import logging
 from dataclasses import dataclass
@@ -15,6 +19,7 @@ from enum import Enum
 import chardet
 import warnings
 
+from app.core.config import settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -90,10 +95,57 @@ class DataProfile:
 class DataProcessor:
     """Advanced data processing engine with comprehensive analysis capabilities."""
     
-    def __init__(self):
+    def __init__(self, max_workers: int = 2):
         self.supported_formats = {'.csv', '.xlsx', '.xls', '.json', '.txt'}
         self.encoding_fallbacks = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
         
+    async def process_file_isolated(self, file_path: Path, file_id: str) -> DataProfile:
+        """
+        Run process_file in a worker process.
+        
+        Profiling is CPU-bound pandas work; running it out of process keeps the
+        API worker's event loop and GIL free for request handling.
+        """
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        try:
+            return await loop.run_in_executor(executor, _process_file_in_worker, file_path, file_id)
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM-killed), which fails every pending call. Replace the
+            # pool and retry once: a crash caused by another file succeeds now, while a
+            # file that kills its worker again is reported as failed
+            logger.error(f"Profiling worker pool broke while processing {file_path}; restarting it")
+            self._discard_executor(executor)
+            return await loop.run_in_executor(
+                self._get_executor(), _process_file_in_worker, file_path, file_id
+            )
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Return the worker pool, starting it on first use."""
+        if self._executor is None:
+            # Forking this process, which already runs thread pools and client threads,
+            # can deadlock the child; forkserver workers start from a clean process
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context(method)
+            )
+        return self._executor
+    
+    def _discard_executor(self, executor: ProcessPoolExecutor) -> None:
+        """Drop a broken pool unless a concurrent caller has already replaced it."""
+        if self._executor is executor:
+            self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    def shutdown(self):
+        """Stop the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
     async def process_file(self, file_path: Path, file_id: str) -> DataProfile:
         """
         Process uploaded file and generate comprehensive data profile.
@@ -343,7 +395,9 @@ class DataProcessor:
                 statistics = self._calculate_type_specific_stats(series, data_type)
                 
                 # Quality assessment for this column
-                quality_score, quality_issues = self._assess_column_quality(series, data_type)
+                quality_score, quality_issues = self._assess_column_quality(
+                    series, data_type, null_count, unique_count, statistics
+                )
                 
                 # Sample values
                 sample_values = self._get_sample_values(series)
@@ -413,43 +467,50 @@ class DataProcessor:
         
         try:
             if data_type == DataType.NUMERIC:
-                stats.update({
-                    'min': float(series.min()) if pd.notna(series.min()) else None,
-                    'max': float(series.max()) if pd.notna(series.max()) else None,
-                    'mean': float(series.mean()) if pd.notna(series.mean()) else None,
-                    'median': float(series.median()) if pd.notna(series.median()) else None,
-                    'std': float(series.std()) if pd.notna(series.std()) else None,
-                    'variance': float(series.var()) if pd.notna(series.var()) else None,
-                    'skewness': float(series.skew()) if pd.notna(series.skew()) else None,
-                    'kurtosis': float(series.kurtosis()) if pd.notna(series.kurtosis()) else None,
-                    'q25': float(series.quantile(0.25)) if pd.notna(series.quantile(0.25)) else None,
-                    'q75': float(series.quantile(0.75)) if pd.notna(series.quantile(0.75)) else None,
-                    'outliers_count': self._count_outliers(series)
-                })
+                # Evaluate each reduction once
+                q25, median, q75 = series.quantile([0.25, 0.5, 0.75]).tolist()
+                values = {
+                    'min': series.min(),
+                    'max': series.max(),
+                    'mean': series.mean(),
+                    'median': median,
+                    'std': series.std(),
+                    'variance': series.var(),
+                    'skewness': series.skew(),
+                    'kurtosis': series.kurtosis(),
+                    'q25': q25,
+                    'q75': q75
+                }
+                stats.update({key: float(value) if pd.notna(value) else None for key, value in values.items()})
+                stats['outliers_count'] = self._count_outliers(series, q25, q75)
                 
             elif data_type == DataType.DATETIME:
                 non_null = series.dropna()
                 if len(non_null) > 0:
+                    min_date = non_null.min()
+                    max_date = non_null.max()
                     stats.update({
-                        'min_date': non_null.min().isoformat() if pd.notna(non_null.min()) else None,
-                        'max_date': non_null.max().isoformat() if pd.notna(non_null.max()) else None,
-                        'date_range_days': (non_null.max() - non_null.min()).days if len(non_null) > 1 else 0
+                        'min_date': min_date.isoformat() if pd.notna(min_date) else None,
+                        'max_date': max_date.isoformat() if pd.notna(max_date) else None,
+                        'date_range_days': (max_date - min_date).days if len(non_null) > 1 else 0
                     })
                     
             elif data_type in [DataType.CATEGORICAL, DataType.TEXT]:
                 non_null = series.dropna()
                 if len(non_null) > 0:
+                    lengths = non_null.astype(str).str.len()
                     stats.update({
-                        'avg_length': float(non_null.astype(str).str.len().mean()),
-                        'min_length': int(non_null.astype(str).str.len().min()),
-                        'max_length': int(non_null.astype(str).str.len().max()),
-                        'empty_strings': int((non_null.astype(str) == '').sum())
+                        'avg_length': float(lengths.mean()),
+                        'min_length': int(lengths.min()),
+                        'max_length': int(lengths.max()),
+                        'empty_strings': int((lengths == 0).sum())
                     })
                     
             elif data_type == DataType.BOOLEAN:
+                true_count = series.sum()
                 stats.update({
-                    'true_count': int(series.sum()) if pd.notna(series.sum()) else 0,
-                    'false_count': int(len(series) - series.sum() - series.isnull().sum())
+                    'true_count': int(true_count) if pd.notna(true_count) else 0,
+                    'false_count': int(len(series) - true_count - series.isnull().sum())
                 })
                 
         except Exception as e:
@@ -458,11 +519,12 @@ class DataProcessor:
         
         return stats
     
-    def _count_outliers(self, series: pd.Series) -> int:
+    def _count_outliers(self, series: pd.Series, Q1: Optional[float] = None, Q3: Optional[float] = None) -> int:
         """Count outliers using IQR method."""
         try:
-            Q1 = series.quantile(0.25)
-            Q3 = series.quantile(0.75)
+            if Q1 is None or Q3 is None:
+                Q1 = series.quantile(0.25)
+                Q3 = series.quantile(0.75)
             IQR = Q3 - Q1
             lower_bound = Q1 - 1.5 * IQR
             upper_bound = Q3 + 1.5 * IQR
@@ -471,13 +533,25 @@ class DataProcessor:
         except Exception:
             return 0
     
-    def _assess_column_quality(self, series: pd.Series, data_type: DataType) -> Tuple[float, List[str]]:
-        """Assess quality of a single column."""
+    def _assess_column_quality(
+        self,
+        series: pd.Series,
+        data_type: DataType,
+        null_count: Optional[int] = None,
+        unique_count: Optional[int] = None,
+        statistics: Optional[Dict[str, Any]] = None
+    ) -> Tuple[float, List[str]]:
+        """Assess quality of a single column, reusing counts already computed by the caller."""
         issues = []
         score = 100.0
+        statistics = statistics or {}
+        if null_count is None:
+            null_count = series.isnull().sum()
+        if unique_count is None:
+            unique_count = series.nunique()
         
         # Check null percentage
-        null_pct = (series.isnull().sum() / len(series)) * 100
+        null_pct = (null_count / len(series)) * 100
         if null_pct > 50:
             issues.append(f"High null percentage: {null_pct:.1f}%")
             score -= 40
@@ -488,7 +562,7 @@ class DataProcessor:
             score -= 10
         
         # Check uniqueness issues
-        unique_pct = (series.nunique() / len(series)) * 100
+        unique_pct = (unique_count / len(series)) * 100
         if unique_pct == 100:
             issues.append("All values are unique (potential identifier column)")
             score -= 10
@@ -498,7 +572,10 @@ class DataProcessor:
         
         # Type-specific checks
         if data_type == DataType.NUMERIC:
-            if self._count_outliers(series) > len(series) * 0.1:
+            outliers_count = statistics.get('outliers_count')
+            if outliers_count is None:
+                outliers_count = self._count_outliers(series)
+            if outliers_count > len(series) * 0.1:
                 issues.append("High number of outliers detected")
                 score -= 15
                 
@@ -506,8 +583,9 @@ class DataProcessor:
             # Check for inconsistent formatting
             non_null = series.dropna().astype(str)
             if len(non_null) > 0:
-                length_std = non_null.str.len().std()
-                length_mean = non_null.str.len().mean()
+                lengths = non_null.str.len()
+                length_std = lengths.std()
+                length_mean = lengths.mean()
                 if length_std > length_mean:
                     issues.append("Inconsistent text length formatting")
                     score -= 10
@@ -522,7 +600,7 @@ class DataProcessor:
                 return []
             
             sample = non_null.sample(min(n, len(non_null)), random_state=42)
-            return [self._serialize_value(v) for v in sample.tolist()]
+            return self._serialize_column(sample)
         except Exception:
             return []
     
@@ -530,17 +608,29 @@ class DataProcessor:
         """Get most common values and their counts."""
         try:
             value_counts = series.value_counts().head(n)
-            return [(self._serialize_value(k), int(v)) for k, v in value_counts.items()]
+            keys = self._serialize_column(value_counts.index.to_series())
+            return list(zip(keys, value_counts.tolist()))
         except Exception:
             return []
     
+    def _serialize_column(self, series: pd.Series) -> List[Any]:
+        """Serialize a whole column for JSON compatibility, formatting values as _serialize_value does."""
+        notna = series.notna()
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            # tolist() on an object view yields Python ints and floats in one pass
+            values = series.astype(object)
+        else:
+            # Datetimes, bools and mixed object columns keep per-value formatting
+            values = series.map(self._serialize_value, na_action='ignore')
+        if notna.all():
+            return values.tolist()
+        return values.astype(object).where(notna, None).tolist()
+    
     def _serialize_value(self, value: Any) -> Any:
-        """Serialize value for JSON compatibility."""
-        if pd.isna(value):
-            return None
-        elif isinstance(value, (np.integer, int)):
+        """Serialize a non-null value for JSON compatibility."""
+        if isinstance(value, numbers.Integral):
             return int(value)
-        elif isinstance(value, (np.floating, float)):
+        elif isinstance(value, numbers.Real):
             return float(value)
         elif isinstance(value, (pd.Timestamp, datetime)):
             return value.isoformat()
@@ -568,8 +658,8 @@ class DataProcessor:
         # Collect data issues
         issues = []
         
-        # Overall null percentage
-        total_nulls = df.isnull().sum().sum()
+        # Overall null percentage, reusing the per-column counts from profiling
+        total_nulls = sum(int(profile.null_count) for profile in column_profiles)
         total_cells = df.shape[0] * df.shape[1]
         null_percentage = (total_nulls / total_cells) * 100
         
@@ -644,13 +734,10 @@ class DataProcessor:
         try:
             sample_df = df.head(n)
             
-            # Convert to JSON-serializable format
-            sample_data = []
-            for _, row in sample_df.iterrows():
-                row_dict = {}
-                for col, val in row.items():
-                    row_dict[col] = self._serialize_value(val)
-                sample_data.append(row_dict)
+            # Convert to JSON-serializable format one column at a time, then zip into rows
+            columns = sample_df.columns.tolist()
+            values = [self._serialize_column(sample_df.iloc[:, i]) for i in range(len(columns))]
+            sample_data = [dict(zip(columns, row)) for row in zip(*values)]
             
             return sample_data
         except Exception as e:
@@ -664,5 +751,9 @@ class DataProcessor:
             counts[profile.data_type] += 1
         return counts
 
+def _process_file_in_worker(file_path: Path, file_id: str) -> DataProfile:
+    """Worker process entry point for DataProcessor.process_file_isolated."""
+    return asyncio.run(data_processor.process_file(file_path, file_id))
+
 # Global processor instance
-data_processor = DataProcessor()
+data_processor = DataProcessor(max_workers=settings.PROFILE_WORKERS)
@@ -0,0 +1,122 @@
+"""
+Embedding Micro-Batcher
+Coalesces concurrent embedding requests into shared model forward passes.
+"""
+
+import asyncio
+import logging
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from app.services.rag_service import RAGService, get_rag_service
+
+logger = logging.getLogger(__name__)
+
+# How long the first request in a batch waits for others to join
+MAX_WAIT_SECONDS = 0.008
+# Upper bound on texts per forward pass; a single larger request still runs whole
+MAX_BATCH_TEXTS = 256
+
+_Pending = Tuple[List[str], asyncio.Future]
+
+
+class EmbedBatcher:
+    """
+    Queue embedding requests and serve them from one worker task.
+
+    The worker takes the first waiting request, collects whatever else arrives
+    within MAX_WAIT_SECONDS (up to MAX_BATCH_TEXTS texts), encodes the
+    concatenated texts once and hands each caller its slice of the result.
+    """
+
+    def __init__(self, rag_service: Optional[RAGService] = None):
+        self._rag_service = rag_service
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def embed(self, texts: List[str]) -> np.ndarray:
+        """Embed texts, sharing the forward pass with concurrent callers"""
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((texts, future))
+        return await future
+
+    def _ensure_worker(self) -> None:
+        """Start the worker on the running loop the first time it is needed"""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+    async def _collect(self) -> List[_Pending]:
+        """Wait for one request, then gather more until the window or batch fills"""
+        batch = [await self._queue.get()]
+        size = len(batch[0][0])
+        deadline = asyncio.get_running_loop().time() + MAX_WAIT_SECONDS
+
+        while size < MAX_BATCH_TEXTS:
+            timeout = deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            batch.append(item)
+            size += len(item[0])
+
+        return batch
+
+    async def _run(self) -> None:
+        """Worker loop: encode each collected batch and resolve its futures"""
+        while True:
+            batch = await self._collect()
+            # Callers that were cancelled while queued no longer need results
+            batch = [(texts, future) for texts, future in batch if not future.done()]
+            if not batch:
+                continue
+
+            try:
+                rag_service = self._rag_service or get_rag_service()
+                if not rag_service.embedding_model:
+                    await rag_service.initialize()
+
+                all_texts = [text for texts, _ in batch for text in texts]
+                embeddings = await asyncio.to_thread(rag_service._embed, all_texts)
+                logger.debug(f"Embedded {len(all_texts)} texts for {len(batch)} requests")
+            except Exception as e:
+                logger.error(f"Batched embedding failed: {str(e)}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            offset = 0
+            for texts, future in batch:
+                if not future.done():
+                    future.set_result(embeddings[offset:offset + len(texts)])
+                offset += len(texts)
+
+    async def stop(self) -> None:
+        """Stop the worker and fail any requests still queued"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                if not future.done():
+                    future.cancel()
+            self._queue = None
+
+
+# Global batcher instance
+embed_batcher = EmbedBatcher()
@@ -0,0 +1,203 @@
+"""
+File Metadata Cache
+Process-local cache for parsed upload DataFrames,
+invalidated by the file's modification time.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.dataset as ds
+import pyarrow.fs as pa_fs
+
+FRAME_CACHE_SIZE = 4
+
+_frames: "OrderedDict[Tuple[str, int], pd.DataFrame]" = OrderedDict()
+_frames_lock = threading.Lock()
+
+# Match pandas' read_csv, which treats empty strings as nulls
+CSV_CONVERT_OPTIONS = pa_csv.ConvertOptions(strings_can_be_null=True)
+# Parse 1MB blocks in parallel across cores
+CSV_READ_OPTIONS = pa_csv.ReadOptions(use_threads=True, block_size=1 << 20)
+# Map files instead of copying them through buffered reads; warm reads come
+# straight from the page cache
+CSV_FILESYSTEM = pa_fs.LocalFileSystem(use_mmap=True)
+
+
+def _read(path: str) -> pd.DataFrame:
+    """Parse a CSV or Excel file from disk."""
+    if path.lower().endswith('.csv'):
+        try:
+            return table_to_frame(_read_table(path))
+        except pa.ArrowInvalid:
+            # Values Arrow cannot convert consistently; pandas widens the column instead
+            return pd.read_csv(path)
+    return pd.read_excel(path)
+
+
+def _nullable_dtype(arrow_type: pa.DataType) -> Optional[pd.ArrowDtype]:
+    """Map Arrow integer and boolean types to pandas Arrow-backed dtypes."""
+    if pa.types.is_integer(arrow_type) or pa.types.is_boolean(arrow_type):
+        return pd.ArrowDtype(arrow_type)
+    return None
+
+
+def table_to_frame(table: pa.Table) -> pd.DataFrame:
+    """
+    Convert a parsed CSV table to a DataFrame.
+
+    Arrow-backed integer and boolean dtypes keep columns with nulls from being
+    upcast to float/object, so a page of a file converts to the same dtypes as
+    the whole file. Every CSV conversion goes through here.
+    """
+    return table.to_pandas(types_mapper=_nullable_dtype)
+
+
+def text_convert_options(
+    schema: pa.Schema,
+    columns: Optional[List[str]] = None
+) -> Optional[pa_csv.ConvertOptions]:
+    """
+    Convert options that read the date, time and timestamp columns of an inferred
+    schema as strings, or None if it has none.
+
+    pd.read_csv keeps such values as text; Arrow would parse them, normalizing
+    offsets to UTC. timestamp_parsers=[] does not stop date and time inference,
+    so the columns are named explicitly.
+    """
+    temporal = {field.name: pa.string() for field in schema if pa.types.is_temporal(field.type)}
+    if not temporal:
+        return None
+    return pa_csv.ConvertOptions(
+        strings_can_be_null=True,
+        include_columns=columns or [],
+        column_types=temporal
+    )
+
+
+def _read_table(path: str, columns: Optional[List[str]] = None) -> pa.Table:
+    """Parse a CSV into an Arrow table with the multi-threaded reader."""
+    convert_options = CSV_CONVERT_OPTIONS
+    if columns:
+        convert_options = pa_csv.ConvertOptions(strings_can_be_null=True, include_columns=columns)
+    with pa.memory_map(path) as source:
+        table = pa_csv.read_csv(source, read_options=CSV_READ_OPTIONS, convert_options=convert_options)
+
+    # Types are only known after inference, so files with temporal columns parse twice
+    text_options = text_convert_options(table.schema, columns)
+    if text_options is None:
+        return table
+    with pa.memory_map(path) as source:
+        return pa_csv.read_csv(source, read_options=CSV_READ_OPTIONS, convert_options=text_options)
+
+
+def open_csv(
+    source: pa.NativeFile,
+    read_options: pa_csv.ReadOptions = CSV_READ_OPTIONS
+) -> pa_csv.CSVStreamingReader:
+    """
+    Open a streaming CSV reader over a seekable source, reading temporal columns
+    as strings. Column types are fixed from the first block.
+    """
+    reader = pa_csv.open_csv(source, read_options=read_options, convert_options=CSV_CONVERT_OPTIONS)
+    text_options = text_convert_options(reader.schema)
+    if text_options is None:
+        return reader
+    # Only the first block has been parsed; reopen from the start with the overrides
+    reader.close()
+    source.seek(0)
+    return pa_csv.open_csv(source, read_options=read_options, convert_options=text_options)
+
+
+def csv_dataset(path: Union[str, Path]) -> ds.Dataset:
+    """Open a CSV as a memory-mapped dataset, reading temporal columns as strings."""
+    dataset = ds.dataset(
+        str(path),
+        filesystem=CSV_FILESYSTEM,
+        format=ds.CsvFileFormat(convert_options=CSV_CONVERT_OPTIONS)
+    )
+    text_options = text_convert_options(dataset.schema)
+    if text_options is None:
+        return dataset
+    return ds.dataset(
+        str(path),
+        filesystem=CSV_FILESYSTEM,
+        format=ds.CsvFileFormat(convert_options=text_options)
+    )
+
+
+def _cached_frame(path: str, mtime_ns: int) -> pd.DataFrame:
+    """Return the DataFrame for (path, mtime_ns), parsing at most once."""
+    key = (path, mtime_ns)
+    with _frames_lock:
+        df = _frames.get(key)
+        if df is not None:
+            _frames.move_to_end(key)
+            return df
+
+    df = _read(path)
+
+    with _frames_lock:
+        # Drop stale entries for the same path before inserting
+        for stale in [k for k in _frames if k[0] == path]:
+            del _frames[stale]
+        _frames[key] = df
+        while len(_frames) > FRAME_CACHE_SIZE:
+            _frames.popitem(last=False)
+    return df
+
+
+def get_frame(file_path: Union[str, Path]) -> pd.DataFrame:
+    """
+    Get the cached DataFrame for a file. Blocking - call through asyncio.to_thread.
+
+    The returned frame is shared between callers and must not be modified in place.
+    """
+    path = str(file_path)
+    return _cached_frame(path, os.stat(path).st_mtime_ns)
+
+
+def get_cached_frame(file_path: Union[str, Path]) -> Optional[pd.DataFrame]:
+    """Get the DataFrame for a file only if it has already been parsed."""
+    path = str(file_path)
+    with _frames_lock:
+        return _frames.get((path, os.stat(path).st_mtime_ns))
+
+
+def get_columns(file_path: Union[str, Path], columns: List[str]) -> pd.DataFrame:
+    """
+    Get a column subset of a file. Blocking - call through asyncio.to_thread.
+
+    Uses the cached frame when present, otherwise parses only the requested
+    CSV columns. Excel has no cheap partial read, so it is parsed once in full
+    into the frame cache. Unknown columns are ignored; if none match, the full
+    frame is returned.
+    """
+    path = str(file_path)
+    key = (path, os.stat(path).st_mtime_ns)
+    with _frames_lock:
+        df = _frames.get(key)
+
+    if df is None and not path.lower().endswith('.csv'):
+        df = _cached_frame(*key)
+    if df is not None:
+        selected = [col for col in columns if col in df.columns]
+        return df[selected] if selected else df
+
+    available = pd.read_csv(path, nrows=0).columns
+    selected = [col for col in columns if col in available]
+    if not selected:
+        return _cached_frame(*key)
+    return table_to_frame(_read_table(path, selected))[selected]
+
+
+def clear() -> None:
+    """Drop all cached frames."""
+    with _frames_lock:
+        _frames.clear()
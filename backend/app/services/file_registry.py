@@ -0,0 +1,124 @@
+"""
+File Registry Service
+In-memory index of uploaded files keyed by file_id
+"""
+
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class FileRecord:
+    file_id: str
+    original_filename: str
+    file_path: Path
+    status: str = "uploaded"
+    updated_at: datetime = field(default_factory=datetime.now)
+    details: Dict[str, Any] = field(default_factory=dict)
+
+class FileRegistry:
+    def __init__(self):
+        self.files: Dict[str, FileRecord] = {}
+        # Upload directory mtime at the last full scan; unchanged means no new sessions
+        self._scanned_mtime_ns: Optional[int] = None
+
+    def register(self, file_id: str, file_path: Path, original_filename: str) -> FileRecord:
+        """Record an uploaded file."""
+        record = FileRecord(
+            file_id=file_id,
+            original_filename=original_filename,
+            file_path=Path(file_path)
+        )
+        self.files[file_id] = record
+        return record
+
+    def get(self, file_id: str) -> Optional[FileRecord]:
+        """Look up a file by ID."""
+        return self.files.get(file_id)
+
+    def set_status(self, file_id: str, status: str, **details: Any) -> Optional[FileRecord]:
+        """Record a processing state transition for a file."""
+        record = self.files.get(file_id)
+        if record:
+            record.status = status
+            record.updated_at = datetime.now()
+            record.details.update(details)
+        return record
+
+    def remove(self, file_id: str) -> Optional[FileRecord]:
+        """Forget a file."""
+        return self.files.pop(file_id, None)
+
+    def rebuild(self, upload_dir: Path) -> int:
+        """Rebuild the index with a single pass over the upload directory."""
+        files: Dict[str, FileRecord] = {}
+        for file_id, original_filename, file_path in self._scan(Path(upload_dir)):
+            files[file_id] = FileRecord(
+                file_id=file_id,
+                original_filename=original_filename,
+                file_path=file_path
+            )
+
+        self.files = files
+        logger.info(f"File registry rebuilt: {len(files)} files indexed")
+        return len(files)
+
+    def refresh(self, upload_dir: Path) -> int:
+        """Index files on disk that are not registered yet, keeping existing records."""
+        added = 0
+        for file_id, original_filename, file_path in self._scan(Path(upload_dir)):
+            if file_id not in self.files:
+                self.register(file_id, file_path, original_filename)
+                added += 1
+        return added
+
+    def find(self, file_id: str, upload_dir: Path) -> Optional[Path]:
+        """
+        Resolve a file_id to its path on disk.
+
+        Misses rescan the upload directory only when its mtime has changed since
+        the last scan, so repeated lookups of unknown IDs cost a single stat.
+        """
+        record = self.files.get(file_id)
+        if record:
+            if record.file_path.exists():
+                return record.file_path
+            self.files.pop(file_id, None)
+
+        upload_dir = Path(upload_dir)
+        try:
+            mtime_ns = upload_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        if mtime_ns != self._scanned_mtime_ns:
+            self.refresh(upload_dir)
+            record = self.files.get(file_id)
+            if record:
+                return record.file_path
+        return None
+
+    def _scan(self, upload_dir: Path) -> Iterator[Tuple[str, str, Path]]:
+        """Yield (file_id, original_filename, path) for every stored upload and record the scan."""
+        if not upload_dir.is_dir():
+            return
+        # Stat before listing so a session created mid-scan triggers another scan
+        self._scanned_mtime_ns = upload_dir.stat().st_mtime_ns
+        with os.scandir(upload_dir) as sessions:
+            for session in sessions:
+                if not session.is_dir():
+                    continue
+                with os.scandir(session.path) as entries:
+                    for entry in entries:
+                        # Stored as "{file_id}_{original_filename}"
+                        file_id, sep, original_filename = entry.name.partition('_')
+                        if sep and entry.is_file():
+                            yield file_id, original_filename, Path(entry.path)
+
+# Global file registry instance
+file_registry = FileRegistry()
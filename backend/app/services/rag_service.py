@@ -17,7 +17,8 @@ Components:
 import logging
 import os
 import asyncio
-from typing import List, Dict, Any, Optional, Tuple
+import codecs
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import hashlib
 
@@ -59,6 +60,13 @@ class RAGService:
         self.embedding_dimension = 384  # Dimension for all-MiniLM-L6-v2
         self.index_name = "enterprise-insights"
         
+        # Index stats snapshot, kept current locally by store/delete deltas
+        self.index_stats: Optional[Dict[str, Any]] = None
+        self.index_stats_updated: Optional[datetime] = None
+        self.vector_count = 0
+        self.file_vector_counts: Dict[str, int] = {}
+        self._stats_refresh: Optional[asyncio.Future] = None
+        
     async def initialize(self):
         """Initialize the RAG service with embedding model and Pinecone"""
         try:
@@ -111,6 +119,8 @@ class RAGService:
             self.index = self.pinecone_client.Index(self.index_name)
             logger.info("Connected to Pinecone index successfully")
             
+            self._snapshot_index_stats()
+            
         except Exception as e:
             logger.error(f"Failed to initialize Pinecone: {str(e)}")
             raise
@@ -132,14 +142,10 @@ class RAGService:
                 await self.initialize()
             
             # Generate embeddings
-            embeddings = self.embedding_model.encode(
-                texts,
-                convert_to_numpy=True,
-                show_progress_bar=True if len(texts) > 10 else False
-            )
+            embeddings = self._embed(texts)
             
             # Convert numpy arrays to lists for JSON serialization
-            embeddings_list = [embedding.tolist() for embedding in embeddings]
+            embeddings_list = embeddings.tolist()
             
             logger.info(f"Generated {len(embeddings_list)} embeddings successfully")
             return embeddings_list
@@ -148,6 +154,48 @@ class RAGService:
             logger.error(f"Failed to generate embeddings: {str(e)}")
             raise
     
+    def _embed(self, texts: List[str]) -> np.ndarray:
+        """
+        Encode texts with the loaded model
+        
+        Blocking - call through asyncio.to_thread from async code. The model
+        must already be loaded.
+        """
+        return self.embedding_model.encode(
+            texts,
+            convert_to_numpy=True,
+            show_progress_bar=len(texts) > 10
+        )
+    
+    @staticmethod
+    def _chunk_bounds(text: str, chunk_size: int, overlap: int) -> List[Tuple[int, int]]:
+        """
+        Compute (start, end) character offsets for each chunk window
+        
+        Boundaries are found with str.rfind, which scans in C, so the loop
+        only does integer arithmetic per window.
+        """
+        bounds = []
+        text_length = len(text)
+        start = 0
+        
+        while start < text_length:
+            end = min(start + chunk_size, text_length)
+            
+            # Try to break at sentence boundaries
+            if end < text_length:
+                # Look for sentence ending within the last 100 characters
+                sentence_end = text.rfind('.', start, end)
+                if sentence_end > start + chunk_size - 100:
+                    end = sentence_end + 1
+            
+            bounds.append((start, end))
+            
+            # Move start position with overlap
+            start = end - overlap if end < text_length else text_length
+        
+        return bounds
+    
     def chunk_document(
         self, 
         text: str, 
@@ -169,46 +217,93 @@ class RAGService:
             logger.info(f"Chunking document of length {len(text)} characters")
             
             chunks = []
-            start = 0
-            chunk_id = 0
+            for start, end in self._chunk_bounds(text, chunk_size, overlap):
+                self._append_chunk(chunks, text[start:end], start, end)
+            
+            logger.info(f"Created {len(chunks)} chunks from document")
+            return chunks
+            
+        except Exception as e:
+            logger.error(f"Failed to chunk document: {str(e)}")
+            raise
+    
+    async def chunk_stream(
+        self,
+        blocks: AsyncIterator[bytes],
+        chunk_size: int = 1000,
+        overlap: int = 200
+    ) -> Tuple[List[DocumentChunk], int]:
+        """
+        Chunk a UTF-8 byte stream without holding the whole document in memory
+        
+        Produces the same chunks as chunk_document on the decoded text. Only
+        windows that end before the buffered text does are cut early, so the
+        sentence-boundary search always sees the same characters.
+        
+        Args:
+            blocks: Async iterator of raw bytes, e.g. reads from an upload
+            chunk_size: Maximum size of each chunk in characters
+            overlap: Number of characters to overlap between chunks
+            
+        Returns:
+            Tuple of (DocumentChunk objects, total document length in characters)
+        """
+        try:
+            decoder = codecs.getincrementaldecoder('utf-8')()
+            chunks = []
+            buffer = ""
+            offset = 0  # Document position of buffer[0]
             
-            while start < len(text):
-                end = min(start + chunk_size, len(text))
+            async for block in blocks:
+                buffer += decoder.decode(block)
+                pos = 0
                 
-                # Try to break at sentence boundaries
-                if end < len(text):
-                    # Look for sentence ending within the last 100 characters
-                    sentence_end = text.rfind('.', start, end)
-                    if sentence_end > start + chunk_size - 100:
+                while len(buffer) - pos > chunk_size:
+                    end = pos + chunk_size
+                    sentence_end = buffer.rfind('.', pos, end)
+                    if sentence_end > end - 100:
                         end = sentence_end + 1
+                    
+                    self._append_chunk(chunks, buffer[pos:end], offset + pos, offset + end)
+                    pos = end - overlap
                 
-                chunk_text = text[start:end].strip()
-                
-                if chunk_text:  # Only add non-empty chunks
-                    chunk = DocumentChunk(
-                        id=f"chunk_{chunk_id}",
-                        text=chunk_text,
-                        start_pos=start,
-                        end_pos=end,
-                        metadata={
-                            "chunk_index": chunk_id,
-                            "character_count": len(chunk_text),
-                            "word_count": len(chunk_text.split())
-                        }
-                    )
-                    chunks.append(chunk)
-                    chunk_id += 1
-                
-                # Move start position with overlap
-                start = end - overlap if end < len(text) else len(text)
+                # Drop consumed text once per block rather than once per chunk
+                buffer = buffer[pos:]
+                offset += pos
             
-            logger.info(f"Created {len(chunks)} chunks from document")
-            return chunks
+            buffer += decoder.decode(b'', final=True)
+            for start, end in self._chunk_bounds(buffer, chunk_size, overlap):
+                self._append_chunk(chunks, buffer[start:end], offset + start, offset + end)
+            
+            total_length = offset + len(buffer)
+            logger.info(f"Created {len(chunks)} chunks from streamed document of {total_length} characters")
+            return chunks, total_length
             
         except Exception as e:
-            logger.error(f"Failed to chunk document: {str(e)}")
+            logger.error(f"Failed to chunk document stream: {str(e)}")
             raise
     
+    @staticmethod
+    def _append_chunk(chunks: List[DocumentChunk], window: str, start: int, end: int) -> None:
+        """Strip a chunk window and append it to chunks unless it is empty"""
+        chunk_text = window.strip()
+        if not chunk_text:
+            return
+        
+        chunk_id = len(chunks)
+        # Fields are built here from known-good values, so skip validation
+        chunks.append(DocumentChunk.model_construct(
+            id=f"chunk_{chunk_id}",
+            text=chunk_text,
+            start_pos=start,
+            end_pos=end,
+            metadata={
+                "chunk_index": chunk_id,
+                "character_count": len(chunk_text),
+                "word_count": len(chunk_text.split())
+            }
+        ))
+    
     async def store_vectors(
         self, 
         chunks: List[DocumentChunk], 
@@ -277,6 +372,10 @@ class RAGService:
             
             logger.info(f"Successfully stored {total_upserted} vectors for file {file_id}")
             
+            # Track the delta locally instead of re-reading index stats
+            self.vector_count += total_upserted
+            self.file_vector_counts[file_id] = self.file_vector_counts.get(file_id, 0) + total_upserted
+            
             return VectorStoreResponse(
                 file_id=file_id,
                 chunks_stored=len(chunks),
@@ -858,9 +957,39 @@ class RAGService:
             logger.error(f"Text relevance calculation failed: {str(e)}")
             return 0.0
     
-    async def get_stats(self) -> Dict[str, Any]:
+    def _snapshot_index_stats(self) -> Dict[str, Any]:
+        """Read index statistics from Pinecone and reset the local vector count"""
+        index_stats = self.index.describe_index_stats()
+        self.index_stats = index_stats
+        self.index_stats_updated = datetime.utcnow()
+        self.vector_count = index_stats.get("total_vector_count", 0)
+        return index_stats
+    
+    async def _refresh_index_stats(self) -> Dict[str, Any]:
+        """Refresh the index stats snapshot, sharing one Pinecone call between concurrent callers"""
+        if self._stats_refresh is None or self._stats_refresh.done():
+            self._stats_refresh = asyncio.ensure_future(
+                asyncio.to_thread(self._snapshot_index_stats)
+            )
+        return await asyncio.shield(self._stats_refresh)
+    
+    async def get_index_stats(self, max_age_seconds: float) -> Dict[str, Any]:
+        """Get the index stats snapshot, re-reading Pinecone only once it is older than max_age_seconds"""
+        if (
+            self.index_stats is None
+            or self.index_stats_updated is None
+            or (datetime.utcnow() - self.index_stats_updated).total_seconds() > max_age_seconds
+        ):
+            return await self._refresh_index_stats()
+        return self.index_stats
+    
+    async def get_stats(self, refresh: bool = False) -> Dict[str, Any]:
         """
         Get comprehensive RAG system statistics
+        
+        Args:
+            refresh: Re-read index statistics from Pinecone instead of using
+                the snapshot plus locally tracked deltas
         """
         try:
             logger.info("Retrieving RAG system statistics")
@@ -869,16 +998,19 @@ class RAGService:
                 await self.initialize()
             
             # Get index statistics
-            index_stats = self.index.describe_index_stats()
+            if refresh or self.index_stats is None:
+                index_stats = await self._refresh_index_stats()
+            else:
+                index_stats = self.index_stats
             
             return {
-                "total_vectors": index_stats.get("total_vector_count", 0),
+                "total_vectors": self.vector_count,
                 "total_files": len(index_stats.get("namespaces", {})),
                 "index_name": self.index_name,
                 "embedding_model": self.model_name,
                 "embedding_dimension": self.embedding_dimension,
                 "index_size_bytes": index_stats.get("index_fullness", 0),
-                "last_updated": datetime.utcnow().isoformat(),
+                "last_updated": self.index_stats_updated.isoformat(),
                 "health_status": "healthy",
                 "namespaces": index_stats.get("namespaces", {})
             }
@@ -912,6 +1044,13 @@ class RAGService:
             
             logger.info(f"Deleted vectors for file {file_id}")
             
+            deleted_count = self.file_vector_counts.pop(file_id, None)
+            if deleted_count is None:
+                # Vectors stored before this process started; count is unknown
+                self.index_stats = None
+            else:
+                self.vector_count = max(self.vector_count - deleted_count, 0)
+            
             return {
                 "file_id": file_id,
                 "success": True,
@@ -1021,6 +1160,9 @@ async def get_rag_service_async() -> RAGService:
     """
     Async wrapper for getting RAG service instance
     
+    Use this one with Depends: FastAPI runs sync dependencies in the
+    threadpool, which would cost a thread hop on every request.
+    
     Returns:
         RAGService: Configured RAG service instance
     """
@@ -8,6 +8,8 @@ import sys
 import time
 import psutil
 import asyncio
+import logging
+import socket
 import subprocess
 from datetime import datetime, timezone
 from pathlib import Path
@@ -76,8 +78,6 @@ class TerminalMonitor:
         
     def _setup_monitor_logging(self):
         """Setup dedicated logging for terminal monitoring"""
-        import logging
-        
         # Create dedicated logger for terminal monitoring
         self.monitor_logger = logging.getLogger("terminal_monitor")
         self.monitor_logger.setLevel(logging.INFO)
@@ -177,7 +177,6 @@ class TerminalMonitor:
     def check_port_status(self, port: int) -> bool:
         """Check if port is in use"""
         try:
-            import socket
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
                 sock.settimeout(1)
                 result = sock.connect_ex(('localhost', port))
@@ -355,9 +354,10 @@ class TerminalMonitor:
         except Exception as e:
             self.monitor_logger.error(f"Error in async monitoring: {e}")
     
-    def get_status_report(self) -> Dict[str, Any]:
-        """Get formatted status report"""
-        status_data = self.collect_terminal_status()
+    def get_status_report(self, status_data: Optional[TerminalMonitorData] = None) -> Dict[str, Any]:
+        """Get formatted status report, collecting fresh status unless one is given"""
+        if status_data is None:
+            status_data = self.collect_terminal_status()
         
         # Convert process info to dict and handle datetime serialization
         process_info = None
@@ -3,14 +3,26 @@ Enterprise Insights Copilot - Main FastAPI Application
 MAANG-level backend with multi-agent AI capabilities
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from anyio import to_thread
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from app.core.config import settings
+from app.core import readiness_state, resource_cache
 from app.core.logging import setup_logging
 from app.core.security import setup_security_middleware
 from app.api.v1.api import api_router
+from app.api.v1.health import check_file_system, run_readiness_checks
 from app.middleware.cors import setup_cors
 from app.middleware.request_id import setup_request_middleware
 from app.middleware.error_handler import setup_error_handling
+from app.middleware.compression import setup_compression
+from app.middleware.health_interceptor import setup_health_interceptor
+from app.services.file_registry import file_registry
+from app.services.data_processor import data_processor
+from app.services.embed_batcher import embed_batcher
 
 # Set up logging
 setup_logging()
@@ -23,6 +35,7 @@ app = FastAPI(
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     docs_url="/docs" if settings.ENVIRONMENT != "production" else None,
     redoc_url="/redoc" if settings.ENVIRONMENT != "production" else None,
+    default_response_class=ORJSONResponse,
 )
 
 # Set up middleware (order matters!)
@@ -30,6 +43,8 @@ setup_error_handling(app)      # Must be first to catch all errors
 setup_request_middleware(app)  # Request tracking and correlation
 setup_security_middleware(app) # Security headers, rate limiting, CORS
 setup_cors(app)               # CORS handling
+setup_compression(app)        # Compress large JSON payloads; event streams pass through
+setup_health_interceptor(app)  # Liveness probes skip everything above
 
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
@@ -40,11 +55,29 @@ async def startup_event():
     print(f"🚀 {settings.PROJECT_NAME} v{settings.VERSION} starting up...")
     print(f"📊 Environment: {settings.ENVIRONMENT}")
     print(f"🔧 Debug mode: {settings.DEBUG}")
+    # Run new tasks eagerly until their first suspension point (Python 3.12+)
+    loop = asyncio.get_running_loop()
+    if hasattr(asyncio, "eager_task_factory"):
+        loop.set_task_factory(asyncio.eager_task_factory)
+    # Size both thread pools explicitly: Starlette's (sync endpoints, UploadFile I/O)
+    # and the loop's default executor (asyncio.to_thread); CPU-bound file
+    # processing runs in data_processor's process pool instead
+    to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=settings.THREADPOOL_SIZE))
+    file_registry.rebuild(Path(settings.UPLOAD_DIR))
+    resource_cache.start()
+    readiness_state.start(run_readiness_checks)
+    # Probe the upload and log directories once up front
+    check_file_system()
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Application shutdown event handler"""
     print(f"🛑 {settings.PROJECT_NAME} shutting down...")
+    await resource_cache.stop()
+    await readiness_state.stop()
+    await embed_batcher.stop()
+    data_processor.shutdown()
 
 if __name__ == "__main__":
     import uvicorn
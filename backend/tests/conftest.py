@@ -13,7 +13,7 @@ from fastapi.testclient import TestClient
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.main import app
+from main import app
 from app.core.config import settings
 
 # Test environment variables
@@ -3,7 +3,7 @@ import asyncio
 from httpx import AsyncClient
 from fastapi.testclient import TestClient
 
-from app.main import app
+from main import app
 
 
 class TestAPI:
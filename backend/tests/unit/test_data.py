@@ -0,0 +1,111 @@
+"""
+Unit tests for data preview loading.
+"""
+
+import pandas as pd
+import pytest
+
+from app.api.v1 import data
+from app.services import file_meta_cache
+
+
+@pytest.fixture(autouse=True)
+def empty_frame_cache():
+    """Start and finish every test without cached frames."""
+    file_meta_cache.clear()
+    yield
+    file_meta_cache.clear()
+
+
+class TestPreviewParity:
+    """A page is the same whether it is streamed or sliced from the cached frame."""
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("page,page_size", [(1, 1), (1, 3), (2, 2)])
+    async def test_cached_matches_uncached(self, tmp_path, page, page_size):
+        """Test integer and boolean columns with nulls keep their values and dtypes."""
+        path = tmp_path / "nulls.csv"
+        path.write_text("a,b,c,d\n1,x,True,1.5\n,y,,\n3,z,False,2.5\n")
+        
+        uncached = await data._load_data_for_preview(path, page, page_size, None)
+        assert file_meta_cache.get_cached_frame(path) is None
+        
+        file_meta_cache.get_frame(path)
+        cached = await data._load_data_for_preview(path, page, page_size, None)
+        
+        assert cached.dtypes.to_dict() == uncached.dtypes.to_dict()
+        assert data._to_records(cached) == data._to_records(uncached)
+    
+    @pytest.mark.asyncio
+    async def test_type_conflict_after_first_block(self, tmp_path):
+        """Test a value contradicting the first block's types falls back to the full parse."""
+        path = tmp_path / "mixed.csv"
+        rows = "".join(f"{i},x{i}\n" for i in range(150_000))
+        path.write_text("a,b\n" + rows + "oops,z\n")
+        
+        page = await data._load_data_for_preview(path, 15_000, 10, None)
+        
+        records = data._to_records(page)
+        assert [row["a"] for row in records] == [str(i) for i in range(149_990, 150_000)]
+
+
+TEMPORAL_CSV = (
+    "id,when,day,at\n"
+    "1,2024-01-02T10:00:00+02:00,2024-01-02,10:00:00\n"
+    "2,2024-01-03T10:00:00.250+02:00,,11:30:00\n"
+)
+
+
+class TestTemporalColumns:
+    """Date and timestamp text is returned as written, as pd.read_csv keeps it."""
+    
+    @pytest.fixture
+    def path(self, tmp_path):
+        """A CSV with timestamp, date and time columns."""
+        path = tmp_path / "temporal.csv"
+        path.write_text(TEMPORAL_CSV)
+        return path
+    
+    @pytest.mark.asyncio
+    async def test_preview_matches_pandas(self, path):
+        """Test streamed and cached preview pages keep the original text."""
+        expected = data._to_records(pd.read_csv(path))
+        
+        uncached = await data._load_data_for_preview(path, 1, 10, None)
+        file_meta_cache.get_frame(path)
+        cached = await data._load_data_for_preview(path, 1, 10, None)
+        
+        assert data._to_records(uncached) == expected
+        assert data._to_records(cached) == expected
+    
+    def test_search_matches_pandas(self, path):
+        """Test the Arrow scan searches and returns temporal columns as text."""
+        search_columns, results, total = data._search_csv(path, "+02:00", None, 10)
+        
+        assert total == 2
+        assert data._to_records(results) == data._to_records(pd.read_csv(path))
+    
+    def test_export_matches_pandas(self, path):
+        """Test CSV and NDJSON exports write the values pandas would."""
+        expected = pd.read_csv(path)
+        df = file_meta_cache.get_frame(path)
+        
+        assert "".join(data._csv_chunks(df)) == "".join(data._csv_chunks(expected))
+        assert "".join(data._ndjson_chunks(df)) == "".join(data._ndjson_chunks(expected))
+
+
+class TestToRecords:
+    """Records serialize values the same way as data profiles."""
+    
+    def test_datetimes_use_isoformat(self):
+        """Test fractional seconds and UTC offsets survive serialization."""
+        when = pd.Series(pd.to_datetime(["2024-01-02 10:00:00.250", None]))
+        df = pd.DataFrame({
+            "naive": when,
+            "aware": when.dt.tz_localize("Europe/Berlin"),
+        })
+        
+        assert data._to_records(df) == [
+            {"naive": "2024-01-02T10:00:00.250000", "aware": "2024-01-02T10:00:00.250000+01:00"},
+            {"naive": None, "aware": None},
+        ]
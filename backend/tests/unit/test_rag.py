@@ -0,0 +1,100 @@
+"""
+Unit tests for RAG document chunking.
+"""
+
+import base64
+
+import numpy as np
+import pytest
+
+from app.api.v1.rag import _encode_embeddings
+from app.services.rag_service import RAGService
+
+
+ASCII_TEXT = " ".join(
+    f"Sentence number {i} talks about quarterly revenue." for i in range(200)
+)
+MULTIBYTE_TEXT = " ".join(
+    f"Umsatz für Quartal {i} — 売上高は増加しました 📈. Café naïve." for i in range(150)
+)
+
+
+async def _blocks(data: bytes, block_size: int):
+    """Yield data in fixed-size byte blocks, splitting multibyte characters."""
+    for start in range(0, len(data), block_size):
+        yield data[start:start + block_size]
+
+
+def _spans(chunks):
+    """Comparable (text, start, end) tuples for a list of chunks."""
+    return [(chunk.text, chunk.start_pos, chunk.end_pos) for chunk in chunks]
+
+
+class TestChunkStream:
+    """chunk_stream must produce the same chunks as chunk_document."""
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("text", [ASCII_TEXT, MULTIBYTE_TEXT, "", "Short text."])
+    @pytest.mark.parametrize("block_size", [1, 3, 64, 1000, 1 << 20])
+    @pytest.mark.parametrize("chunk_size,overlap", [(1000, 200), (120, 30)])
+    async def test_matches_chunk_document(self, text, block_size, chunk_size, overlap):
+        """Test streamed chunks match across block sizes that split characters."""
+        service = RAGService()
+        expected = service.chunk_document(text, chunk_size=chunk_size, overlap=overlap)
+        
+        chunks, total_length = await service.chunk_stream(
+            _blocks(text.encode("utf-8"), block_size), chunk_size=chunk_size, overlap=overlap
+        )
+        
+        assert _spans(chunks) == _spans(expected)
+        assert [chunk.id for chunk in chunks] == [chunk.id for chunk in expected]
+        assert total_length == len(text)
+
+
+def _decode(payload, dtype, shape):
+    """Decode a base64 embeddings payload the way a client would."""
+    raw = base64.b64decode(payload["embeddings_b64"])
+    return np.frombuffer(raw, dtype=dtype).reshape(shape)
+
+
+class TestEncodeEmbeddings:
+    """Wire formats of /embed must decode back to the original vectors."""
+    
+    @pytest.fixture
+    def embeddings(self) -> np.ndarray:
+        """Float32 vectors like the embedding model's, including an all-zero row."""
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(4, 384)).astype(np.float32)
+        vectors[2] = 0.0
+        return vectors
+    
+    def test_fp32_is_plain_lists(self, embeddings):
+        """Test fp32 is returned as JSON float lists."""
+        payload = _encode_embeddings(embeddings, "fp32")
+        assert np.array_equal(np.asarray(payload["embeddings"], dtype=np.float32), embeddings)
+    
+    def test_fp16_round_trip(self, embeddings):
+        """Test fp16 decodes as little-endian half floats in row-major order."""
+        payload = _encode_embeddings(embeddings, "fp16")
+        assert set(payload) == {"embeddings_b64"}
+        
+        decoded = _decode(payload, "<f2", embeddings.shape)
+        np.testing.assert_allclose(decoded, embeddings, rtol=1e-3, atol=1e-3)
+    
+    def test_int8_round_trip(self, embeddings):
+        """Test int8 values times their per-vector scale give back the vectors."""
+        payload = _encode_embeddings(embeddings, "int8")
+        scales = np.asarray(payload["scales"])
+        assert scales.shape == (len(embeddings),)
+        
+        quantized = _decode(payload, np.int8, embeddings.shape)
+        # The largest component of each non-zero vector uses the full int8 range
+        assert np.abs(quantized).max(axis=1).tolist() == [127, 127, 0, 127]
+        decoded = quantized * scales[:, None]
+        assert np.all(np.abs(decoded - embeddings) <= scales[:, None] / 2 + 1e-6)
+    
+    def test_int8_zero_vector(self, embeddings):
+        """Test an all-zero vector gets scale 1.0 and zero codes instead of NaNs."""
+        payload = _encode_embeddings(embeddings, "int8")
+        assert payload["scales"][2] == 1.0
+        assert not _decode(payload, np.int8, embeddings.shape)[2].any()
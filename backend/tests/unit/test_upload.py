@@ -0,0 +1,72 @@
+"""
+Unit tests for upload validation.
+"""
+
+import io
+
+import pandas as pd
+import pytest
+from fastapi import UploadFile
+from starlette.datastructures import Headers
+
+from app.api.v1 import upload
+
+
+def _upload_file(filename: str, content: bytes) -> UploadFile:
+    """Build an UploadFile as the multipart parser would."""
+    return UploadFile(
+        file=io.BytesIO(content),
+        size=len(content),
+        filename=filename,
+        headers=Headers({"content-type": "text/csv"}),
+    )
+
+
+class TestExecutableRejection:
+    """Executables are rejected from their first bytes, before anything is saved."""
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("head", [b"MZ", b"\x7fELF", b"PK\x03\x04"])
+    async def test_rejected_before_save(self, head, tmp_path, monkeypatch):
+        """Test an executable disguised as a CSV is never written or scanned."""
+        def fail(*args, **kwargs):
+            raise AssertionError("executable upload reached disk")
+        
+        monkeypatch.setattr(upload, "save_upload", fail)
+        monkeypatch.setattr(upload, "analyze_file", fail)
+        upload_dir = tmp_path / "session"
+        
+        response = await upload._process_upload(
+            _upload_file("report.csv", head + b"a" * 2000), "file-1", upload_dir
+        )
+        
+        assert response.status == "security_failed"
+        assert upload.EXECUTABLE_ERROR in response.validation_results["errors"]
+        assert not upload_dir.exists()
+    
+    def test_is_executable(self):
+        """Test signature detection on leading bytes."""
+        assert upload.is_executable(b"MZ\x90\x00")
+        assert not upload.is_executable(b"Name,Age\nJohn,30\n")
+
+
+class TestMetadataPreview:
+    """The upload metadata preview reports what pd.read_csv would."""
+    
+    @pytest.mark.asyncio
+    async def test_temporal_columns_match_pandas(self, tmp_path):
+        """Test date and timestamp columns keep pandas' dtypes and original text."""
+        path = tmp_path / "temporal.csv"
+        path.write_text(
+            "id,when,day\n"
+            "1,2024-01-02T10:00:00+02:00,2024-01-02\n"
+            "2,2024-01-03T10:00:00+02:00,\n"
+        )
+        expected = pd.read_csv(path, nrows=upload.PREVIEW_ROWS)
+        
+        metadata = await upload.generate_file_metadata(path, "temporal.csv")
+        
+        preview = metadata["data_preview"]
+        assert preview["data_types"] == expected.dtypes.astype(str).to_dict()
+        assert preview["data_types"]["when"] == "object"
+        assert pd.DataFrame(preview["sample_data"]).equals(expected.head(3))